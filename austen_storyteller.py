@@ -400,7 +400,7 @@ class JaneAustenStoryGenerator:
         
         # Format the template
         try:
-            story = template.format(**format_info)
+            story = template.format_map(format_info)
         except KeyError as e:
             # Fallback in case template has placeholders we didn't provide
             print(f"Warning: Template formatting error {e}. Using simplified template.")
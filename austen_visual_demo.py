@@ -80,6 +80,10 @@ class AustenVisualDemo(App):
             btn.bind(on_press=demo_func)
             button_panel.add_widget(btn)
         
+        # Size the panel from its fixed-height buttons so resizes don't relayout them
+        button_panel.size_hint_y = None
+        button_panel.bind(minimum_height=button_panel.setter('height'))
+        
         content_layout.add_widget(button_panel)
         
         # Right panel for demo content
@@ -653,6 +657,16 @@ class AustenVisualDemo(App):
         self.demo_panel.add_widget(text_label)
 
 
+def _precise_sleep(seconds):
+    """Sleep until a perf_counter deadline, spinning only for the final millisecond"""
+    target = time.perf_counter() + seconds
+    remaining = target - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < target:
+        pass
+
+
 def run_text_animations_demo():
     """Run a demonstration of the Regency text animations in the terminal"""
     # Create animator
@@ -663,13 +677,13 @@ def run_text_animations_demo():
     print("Jane Austen Storytelling Experience - Regency Text Animations Demo")
     print("=" * 70)
     print("\nDemonstrating various Regency-era text animations and transitions...")
-    time.sleep(2)
+    _precise_sleep(2)
     
     # Demo formal writing transition
     print("\n\nDEMONSTRATION: FORMAL WRITING TRANSITION")
     formal_text = "It is a truth universally acknowledged, that a single man in possession of a good fortune, must be in want of a wife."
     animator.formal_writing_transition(formal_text)
-    time.sleep(2)
+    _precise_sleep(2)
     
     # Demo scene transition
     print("\n\nDEMONSTRATION: SCENE TRANSITION")
@@ -677,14 +691,14 @@ def run_text_animations_demo():
         "The drawing room at Longbourn", 
         "The grand ballroom at Netherfield"
     )
-    time.sleep(2)
+    _precise_sleep(2)
     
     # Demo character dialogue
     print("\n\nDEMONSTRATION: CHARACTER DIALOGUE")
     animator.animated_dialogue("Mr. Darcy", "I have been meditating on the very great pleasure which a pair of fine eyes in the face of a pretty woman can bestow", "looks intently at Elizabeth")
-    time.sleep(1)
+    _precise_sleep(1)
     animator.animated_dialogue("Elizabeth Bennet", "Are you so severe upon your own sex as to doubt the possibility of all this?", "raises an eyebrow")
-    time.sleep(2)
+    _precise_sleep(2)
     
     # Demo social commentary
     print("\n\nDEMONSTRATION: SOCIAL COMMENTARY")
@@ -694,18 +708,18 @@ def run_text_animations_demo():
     # Demo animated chapter heading
     print("\n\nDEMONSTRATION: CHAPTER HEADING")
     animator.animated_chapter_heading(3, "A Most Unexpected Meeting")
-    time.sleep(2)
+    _precise_sleep(2)
     
     # Demo letter
     print("\n\nDEMONSTRATION: REGENCY LETTER")
     letter_content = "I hope this letter finds you in good health and spirits. We have had quite the eventful week at Pemberley, with visitors arriving from as far as London and Bath. The gardens are in full bloom, and the weather has been most agreeable."
     animator.animated_regency_letter("Elizabeth Darcy", "Jane Bingley", letter_content)
-    time.sleep(2)
+    _precise_sleep(2)
     
     print("\n\nRegency Text Animations Demo Complete")
     print("=" * 70)
     print("\nNow launching the Kivy visual demonstration...")
-    time.sleep(3)
+    _precise_sleep(3)
 
 
 def main():
@@ -2,111 +2,137 @@
 Character generation for the Jane Austen storytelling experience.
 """
 
+import itertools
 import random
 
+# Module-private RNG so callers can seed generation without touching the global one
+_rng = random.Random()
+_choice = _rng.choice
+_choices = _rng.choices
+_random = _rng.random
+
+# Character trait pools, shared by every CharacterGenerator instance
+FIRST_NAMES = {
+    'female': (
+        'Elizabeth', 'Jane', 'Emma', 'Anne', 'Catherine', 'Elinor',
+        'Marianne', 'Charlotte', 'Caroline', 'Georgiana', 'Harriet',
+        'Lydia', 'Mary', 'Fanny', 'Isabella', 'Eleanor', 'Sophia'
+    ),
+    'male': (
+        'Fitzwilliam', 'Charles', 'George', 'Henry', 'Edward', 'William',
+        'Frederick', 'John', 'Thomas', 'James', 'Edmund', 'Robert',
+        'Christopher', 'Frank', 'Philip', 'Richard', 'Arthur'
+    )
+}
+
+LAST_NAMES = (
+    'Bennet', 'Darcy', 'Bingley', 'Woodhouse', 'Knightley', 'Wentworth',
+    'Elliot', 'Crawford', 'Bertram', 'Dashwood', 'Ferrars', 'Willoughby',
+    'Brandon', 'Collins', 'Lucas', 'Tilney', 'Morland', 'Churchill',
+    'Elton', 'Fairfax', 'Musgrove', 'Croft', 'Wickham', 'Thorpe'
+)
+
+SOCIAL_CLASSES = {
+    'upper': (
+        'wealthy landowner', 'aristocrat', 'baronet', 'heir to a large estate',
+        'person of noble birth', 'member of the peerage', 'lady of rank',
+        'gentleman of fortune', 'distinguished lady of society'
+    ),
+    'middle': (
+        'country gentleman', 'refined lady', 'respected tradesman',
+        'gentleman of modest means', 'daughter of a merchant',
+        'professional man', 'wife of a professional man', 'governess from a good family'
+    ),
+    'lower': (
+        'tenant farmer', 'shopkeeper', 'craftsman', 'servant in a great house',
+        'person of humble birth but good connections', 'tradesperson',
+        'farmer with a small holding', 'lady\'s companion'
+    )
+}
+
+OCCUPATIONS = {
+    'male': (
+        'clergyman', 'naval officer', 'estate manager', 'physician',
+        'barrister', 'military officer', 'magistrate', 'scholar',
+        'landowner', 'merchant', 'banker', 'architect', 'gentleman farmer'
+    ),
+    'female': (
+        'governess', 'lady\'s companion', 'accomplished musician',
+        'skilled painter', 'estate mistress', 'household manager',
+        'charitable worker', 'writer of letters and journals',
+        'needlework expert', 'housekeeper', 'hostess of social gatherings'
+    ),
+    'neutral': (
+        'guardian of younger siblings', 'caretaker of elderly relatives',
+        'correspondent with distant connections', 'reader and intellectual',
+        'manager of family affairs', 'local benefactor', 'traveler'
+    )
+}
+
+PERSONALITY_TRAITS = {
+    'positive': (
+        'witty', 'intelligent', 'amiable', 'sensible', 'charming',
+        'composed', 'elegant', 'gracious', 'kind-hearted', 'refined',
+        'accomplished', 'spirited', 'thoughtful', 'affectionate', 'dutiful'
+    ),
+    'neutral': (
+        'reserved', 'private', 'contemplative', 'traditional', 'careful',
+        'proper', 'conventional', 'practical', 'deliberate', 'methodical',
+        'observant', 'attentive', 'modest', 'temperate', 'moderate'
+    ),
+    'negative': (
+        'proud', 'prejudiced', 'vain', 'impulsive', 'indiscreet',
+        'fanciful', 'gossiping', 'imposing', 'scheming', 'calculating',
+        'envious', 'pompous', 'frivolous', 'flirtatious', 'insolent'
+    )
+}
+
+BACKSTORIES = (
+    "raised in a large family with little fortune but much affection",
+    "educated abroad and recently returned to England",
+    "orphaned at a young age and raised by a distant relative",
+    "from a family fallen on hard times after previous prosperity",
+    "seeking to restore family honor after a scandal",
+    "the unexpected inheritor of a modest but comfortable property",
+    "connected to influential people but personally of limited means",
+    "having survived a serious illness that altered their perspective on life",
+    "returned from the colonies with experiences but diminished fortune",
+    "well-traveled but now settling into provincial society",
+    "recovering from a broken engagement that caused much distress",
+    "new to the neighborhood and subject to much speculation",
+    "a childhood friend of an important local figure",
+    "possessing a talent that sets them apart from typical society",
+    "bearing a resemblance to someone of notorious reputation"
+)
+
+# Gender-specific occupation pools; any other gender falls back to the neutral pool
+GENDERED_OCCUPATIONS = {
+    gender: OCCUPATIONS[gender] for gender in ('male', 'female')
+}
+
+# Flattened pools so social class and personality are a single draw
+ALL_SOCIAL_CLASSES = tuple(itertools.chain.from_iterable(SOCIAL_CLASSES.values()))
+ALL_PERSONALITY_TRAITS = tuple(itertools.chain.from_iterable(PERSONALITY_TRAITS.values()))
+
+
 class CharacterGenerator:
-    def __init__(self):
-        # Initialize character traits dictionaries
-        self.first_names = {
-            'female': [
-                'Elizabeth', 'Jane', 'Emma', 'Anne', 'Catherine', 'Elinor',
-                'Marianne', 'Charlotte', 'Caroline', 'Georgiana', 'Harriet',
-                'Lydia', 'Mary', 'Fanny', 'Isabella', 'Eleanor', 'Sophia'
-            ],
-            'male': [
-                'Fitzwilliam', 'Charles', 'George', 'Henry', 'Edward', 'William',
-                'Frederick', 'John', 'Thomas', 'James', 'Edmund', 'Robert',
-                'Christopher', 'Frank', 'Philip', 'Richard', 'Arthur'
-            ]
-        }
-        
-        self.last_names = [
-            'Bennet', 'Darcy', 'Bingley', 'Woodhouse', 'Knightley', 'Wentworth',
-            'Elliot', 'Crawford', 'Bertram', 'Dashwood', 'Ferrars', 'Willoughby',
-            'Brandon', 'Collins', 'Lucas', 'Tilney', 'Morland', 'Churchill',
-            'Elton', 'Fairfax', 'Musgrove', 'Croft', 'Wickham', 'Thorpe'
-        ]
-        
-        self.social_classes = {
-            'upper': [
-                'wealthy landowner', 'aristocrat', 'baronet', 'heir to a large estate',
-                'person of noble birth', 'member of the peerage', 'lady of rank',
-                'gentleman of fortune', 'distinguished lady of society'
-            ],
-            'middle': [
-                'country gentleman', 'refined lady', 'respected tradesman',
-                'gentleman of modest means', 'daughter of a merchant',
-                'professional man', 'wife of a professional man', 'governess from a good family'
-            ],
-            'lower': [
-                'tenant farmer', 'shopkeeper', 'craftsman', 'servant in a great house',
-                'person of humble birth but good connections', 'tradesperson',
-                'farmer with a small holding', 'lady\'s companion'
-            ]
-        }
-        
-        self.occupations = {
-            'male': [
-                'clergyman', 'naval officer', 'estate manager', 'physician',
-                'barrister', 'military officer', 'magistrate', 'scholar',
-                'landowner', 'merchant', 'banker', 'architect', 'gentleman farmer'
-            ],
-            'female': [
-                'governess', 'lady\'s companion', 'accomplished musician',
-                'skilled painter', 'estate mistress', 'household manager',
-                'charitable worker', 'writer of letters and journals',
-                'needlework expert', 'housekeeper', 'hostess of social gatherings'
-            ],
-            'neutral': [
-                'guardian of younger siblings', 'caretaker of elderly relatives',
-                'correspondent with distant connections', 'reader and intellectual',
-                'manager of family affairs', 'local benefactor', 'traveler'
-            ]
-        }
-        
-        self.personality_traits = {
-            'positive': [
-                'witty', 'intelligent', 'amiable', 'sensible', 'charming',
-                'composed', 'elegant', 'gracious', 'kind-hearted', 'refined',
-                'accomplished', 'spirited', 'thoughtful', 'affectionate', 'dutiful'
-            ],
-            'neutral': [
-                'reserved', 'private', 'contemplative', 'traditional', 'careful',
-                'proper', 'conventional', 'practical', 'deliberate', 'methodical',
-                'observant', 'attentive', 'modest', 'temperate', 'moderate'
-            ],
-            'negative': [
-                'proud', 'prejudiced', 'vain', 'impulsive', 'indiscreet',
-                'fanciful', 'gossiping', 'imposing', 'scheming', 'calculating',
-                'envious', 'pompous', 'frivolous', 'flirtatious', 'insolent'
-            ]
-        }
-        
-        self.backstories = [
-            "raised in a large family with little fortune but much affection",
-            "educated abroad and recently returned to England",
-            "orphaned at a young age and raised by a distant relative",
-            "from a family fallen on hard times after previous prosperity",
-            "seeking to restore family honor after a scandal",
-            "the unexpected inheritor of a modest but comfortable property",
-            "connected to influential people but personally of limited means",
-            "having survived a serious illness that altered their perspective on life",
-            "returned from the colonies with experiences but diminished fortune",
-            "well-traveled but now settling into provincial society",
-            "recovering from a broken engagement that caused much distress",
-            "new to the neighborhood and subject to much speculation",
-            "a childhood friend of an important local figure",
-            "possessing a talent that sets them apart from typical society",
-            "bearing a resemblance to someone of notorious reputation"
-        ]
+    first_names = FIRST_NAMES
+    last_names = LAST_NAMES
+    social_classes = SOCIAL_CLASSES
+    occupations = OCCUPATIONS
+    personality_traits = PERSONALITY_TRAITS
+    backstories = BACKSTORIES
+    _gendered_occupations = GENDERED_OCCUPATIONS
+    _all_social = ALL_SOCIAL_CLASSES
+    _all_personality = ALL_PERSONALITY_TRAITS
 
     def generate_regency_name(self, gender=None):
         """Generate a typical Regency era name"""
         if gender is None:
-            gender = random.choice(['male', 'female'])
+            gender = 'male' if _random() < 0.5 else 'female'
             
-        first_name = random.choice(self.first_names[gender])
-        last_name = random.choice(self.last_names)
+        first_name = _choice(self.first_names[gender])
+        last_name = _choice(self.last_names)
         
         return f"{first_name} {last_name}"
 
@@ -114,7 +140,7 @@ class CharacterGenerator:
         """Generate a period-appropriate character"""
         # Randomly select gender if not specified
         if gender is None:
-            gender = random.choice(['male', 'female'])
+            gender = 'male' if _random() < 0.5 else 'female'
             
         # Generate name if not provided
         if custom_name:
@@ -123,21 +149,23 @@ class CharacterGenerator:
             name = self.generate_regency_name(gender)
             
         # Select social class and appropriate occupation
-        social_class_category = random.choice(['upper', 'middle', 'lower'])
-        social_class = random.choice(self.social_classes[social_class_category])
+        social_class = _choice(self._all_social)
         
         # Select occupation based on gender or use a neutral one
-        if random.random() < 0.7:  # 70% chance of gender-specific occupation
-            if gender in self.occupations:
-                occupation = random.choice(self.occupations[gender])
-            else:
-                occupation = random.choice(self.occupations['neutral'])
+        # One draw both gates the 70% gender-specific chance and picks the item,
+        # by rescaling r within whichever band it fell into
+        neutral = self.occupations['neutral']
+        r = _random()
+        if r < 0.7:
+            pool = self._gendered_occupations.get(gender, neutral)
+            index = int(r / 0.7 * len(pool))
         else:
-            occupation = random.choice(self.occupations['neutral'])
+            pool = neutral
+            index = int((r - 0.7) / 0.3 * len(pool))
+        occupation = pool[min(index, len(pool) - 1)]
             
         # Select personality traits
-        personality_category = random.choice(['positive', 'neutral', 'negative'])
-        personality = random.choice(self.personality_traits[personality_category])
+        personality = _choice(self._all_personality)
         
         # Create the character dictionary
         character = {
@@ -150,6 +178,54 @@ class CharacterGenerator:
         
         # Add backstory if requested
         if include_backstory:
-            character['backstory'] = random.choice(self.backstories)
+            character['backstory'] = _choice(self.backstories)
             
         return character
+
+    def create_characters(self, count, gender=None, include_backstory=True):
+        """Generate a cast of characters, sampling each attribute for the whole cast at once"""
+        if gender is None:
+            genders = _choices(('male', 'female'), k=count)
+        else:
+            genders = [gender] * count
+        
+        first_names = self._sample_grouped(self.first_names, genders)
+        last_names = _choices(self.last_names, k=count)
+        
+        social_classes = _choices(self._all_social, k=count)
+        
+        # 70% chance of gender-specific occupation, as in create_character
+        gendered = _choices((True, False), weights=(0.7, 0.3), k=count)
+        occupation_keys = [
+            g if use_gendered and g in self._gendered_occupations else 'neutral'
+            for g, use_gendered in zip(genders, gendered)
+        ]
+        occupations = self._sample_grouped(self.occupations, occupation_keys)
+        
+        personalities = _choices(self._all_personality, k=count)
+        
+        characters = [
+            {
+                'name': f"{first} {last}",
+                'gender': g,
+                'social_class': social_class,
+                'occupation': occupation,
+                'personality': personality
+            }
+            for first, last, g, social_class, occupation, personality in zip(
+                first_names, last_names, genders, social_classes, occupations, personalities
+            )
+        ]
+        
+        if include_backstory:
+            for character, backstory in zip(characters, _choices(self.backstories, k=count)):
+                character['backstory'] = backstory
+        
+        return characters
+
+    @staticmethod
+    def _sample_grouped(pools, keys):
+        """Draw one item per key from pools[key], using a single random.choices call per pool"""
+        # Pools are drawn in first-seen key order, so a seeded run doesn't depend on hash order
+        draws = {key: iter(_choices(pools[key], k=keys.count(key))) for key in dict.fromkeys(keys)}
+        return [next(draws[key]) for key in keys]
@@ -4,20 +4,48 @@ A basic viewer for visualizing story data from the Simplified Storyteller.
 This template can be customized to create more sophisticated visualizations.
 """
 
+import mmap
 import os
-import json
-import tkinter as tk
-from tkinter import ttk, scrolledtext
+import sys
+from types import SimpleNamespace
+from utils import ORJSON_AVAILABLE, load_json
+
+# Files at least this large are memory-mapped rather than read into a bytes copy
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Per-character text for the characters tab, filled with str.format_map
+_CHAR_HEADING_TEMPLATE = "{name} - {role}\n"
+_CHAR_TEMPLATE = (
+    "  Gender: {gender}\n"
+    "  Virtue: {virtue}\n"
+    "  Flaw: {flaw}\n"
+    "  Goal: {goal}\n"
+    "  Backstory: {backstory}\n\n"
+)
+
+
+def _to_namespace(data):
+    """Recursively convert nested dicts into SimpleNamespace for attribute access"""
+    return SimpleNamespace(**{
+        key: _to_namespace(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    })
+
+# tkinter is imported inside the methods that build widgets, so importing this
+# module for load_story_data alone doesn't pay Tk's start-up cost
 
 class StoryboardViewer:
     def __init__(self, root, story_data):
         self.root = root
         self.story_data = story_data
+        self.sd = _to_namespace(story_data)
         self.setup_ui()
         
     def setup_ui(self):
+        from tkinter import ttk
+        
         # Configure the main window
-        self.root.title(f"Story Viewer: {self.story_data['theme']['name']}")
+        self.root.title(f"Story Viewer: {self.sd.theme.name}")
         self.root.geometry("800x600")
         
         # Create a notebook with tabs
@@ -40,6 +68,9 @@ class StoryboardViewer:
         self.setup_settings_tab()
     
     def setup_story_tab(self):
+        import tkinter as tk
+        from tkinter import ttk, scrolledtext
+        
         # Create a frame for the story title
         title_frame = ttk.Frame(self.story_frame)
         title_frame.pack(fill='x', padx=10, pady=10)
@@ -47,7 +78,7 @@ class StoryboardViewer:
         # Create a title label
         title_label = ttk.Label(
             title_frame, 
-            text=self.story_data['theme']['name'].upper(),
+            text=self.sd.theme.name.upper(),
             font=('Arial', 16, 'bold')
         )
         title_label.pack(pady=10)
@@ -55,7 +86,7 @@ class StoryboardViewer:
         # Add theme description
         desc_label = ttk.Label(
             title_frame,
-            text=self.story_data['theme']['description'],
+            text=self.sd.theme.description,
             font=('Arial', 10, 'italic')
         )
         desc_label.pack(pady=5)
@@ -68,49 +99,40 @@ class StoryboardViewer:
             height=25,
             font=('Courier New', 10)
         )
-        story_text.pack(fill='both', expand=True, padx=10, pady=10)
-        story_text.insert(tk.END, self.story_data['story_text'])
+        story_text.insert(tk.END, self.sd.story_text)
         story_text.config(state='disabled')  # Make read-only
+        story_text.pack(fill='both', expand=True, padx=10, pady=10)
     
     def setup_characters_tab(self):
-        # Add a canvas with scrollbar for many characters
-        canvas = tk.Canvas(self.characters_frame)
-        scrollbar = ttk.Scrollbar(self.characters_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        import tkinter as tk
+        from tkinter import scrolledtext
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # A single text widget holds every character, rather than a frame of labels each
+        characters_text = scrolledtext.ScrolledText(
+            self.characters_frame,
+            wrap=tk.WORD,
+            font=('Arial', 10)
+        )
+        characters_text.tag_configure('heading', font=('Arial', 11, 'bold'))
+        
+        # Alternating text/tags arguments let Tk insert every character in one call
+        segments = []
+        for character in self.sd.characters:
+            segments += [
+                _CHAR_HEADING_TEMPLATE.format_map(character), 'heading',
+                _CHAR_TEMPLATE.format_map(character), ()
+            ]
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        if segments:
+            characters_text.insert(tk.END, *segments)
+        characters_text.config(state='disabled')  # Make read-only
         
-        # Add characters
-        for i, character in enumerate(self.story_data['characters']):
-            char_frame = ttk.LabelFrame(
-                scrollable_frame,
-                text=f"{character['name']} - {character['role']}"
-            )
-            char_frame.pack(fill='x', expand=True, padx=10, pady=5)
-            
-            # Character details
-            details = [
-                f"Gender: {character['gender']}",
-                f"Virtue: {character['virtue']}",
-                f"Flaw: {character['flaw']}",
-                f"Goal: {character['goal']}",
-                f"Backstory: {character['backstory']}"
-            ]
-            
-            for detail in details:
-                detail_label = ttk.Label(char_frame, text=detail, wraplength=700)
-                detail_label.pack(anchor='w', padx=10, pady=2)
+        # Pack only once filled, so Tk lays the widget out in a single pass
+        characters_text.pack(fill='both', expand=True, padx=10, pady=10)
     
     def setup_settings_tab(self):
+        from tkinter import ttk
+        
         # Create a frame for settings
         settings_container = ttk.Frame(self.settings_frame)
         settings_container.pack(fill='both', expand=True, padx=20, pady=20)
@@ -124,13 +146,13 @@ class StoryboardViewer:
         settings_title.pack(pady=10)
         
         # Settings details
-        settings = self.story_data['settings']
+        settings = self.sd.settings
         
         setting_details = [
-            f"Location: {settings['location']}",
-            f"Season: {settings['season']}",
-            f"Time Period: {settings['time_period']}",
-            f"Created: {self.story_data['timestamp']}"
+            f"Location: {settings.location}",
+            f"Season: {settings.season}",
+            f"Time Period: {settings.time_period}",
+            f"Created: {self.sd.timestamp}"
         ]
         
         for detail in setting_details:
@@ -147,45 +169,53 @@ class StoryboardViewer:
         
         theme_name = ttk.Label(
             theme_frame,
-            text=f"Name: {self.story_data['theme']['name']}",
+            text=f"Name: {self.sd.theme.name}",
             font=('Arial', 11)
         )
         theme_name.pack(anchor='w', padx=10, pady=5)
         
         theme_desc = ttk.Label(
             theme_frame,
-            text=f"Description: {self.story_data['theme']['description']}",
+            text=f"Description: {self.sd.theme.description}",
             font=('Arial', 11),
             wraplength=700
         )
         theme_desc.pack(anchor='w', padx=10, pady=5)
 
 
-def load_story_data():
+def load_story_data(temp_file=None):
     """Load story data from the JSON file"""
-    temp_file = os.path.join('temp', 'storyboard_data.json')
+    if temp_file is None:
+        temp_file = os.path.join('temp', 'storyboard_data.json')
     
     if not os.path.exists(temp_file):
         print(f"Error: Story data file not found at {temp_file}")
         return None
     
     try:
-        with open(temp_file, 'r') as f:
-            return json.load(f)
+        with open(temp_file, 'rb') as f:
+            # orjson can parse straight from the page cache via a memoryview;
+            # the stdlib parser needs bytes, so it always reads the file
+            if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return load_json(view)
+            return load_json(f.read())
     except Exception as e:
         print(f"Error loading story data: {e}")
         return None
 
 
 def main():
-    # Load story data
-    story_data = load_story_data()
+    # Load story data, from the path given on the command line if there is one
+    story_data = load_story_data(sys.argv[1] if len(sys.argv) > 1 else None)
     
     if not story_data:
         print("Could not load story data. Please generate a story first.")
         return
     
     # Create the main window
+    import tkinter as tk
     root = tk.Tk()
     app = StoryboardViewer(root, story_data)
     
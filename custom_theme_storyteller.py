@@ -3,14 +3,30 @@ Custom Theme Storyteller for Jane Austen Experience
 Allows users to create stories with their own themes and settings
 """
 
+import hashlib
+import io
 import os
-import time as import_time
+import pathlib
+import re
+import string
+import subprocess
 import sys
 import random
 import time
-from jane_austen_storyteller import JaneAustenStoryGenerator
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from jane_austen_storyteller import JaneAustenStoryGenerator, CUSTOM_TEMPLATE_PREFIX
 from visual_imagery import VisualImageryGenerator
 from austen_quotes import AustenQuoteGenerator
+from utils import dump_story_json, load_json, open_atomic, print_menu
+
+def _content_key(*values):
+    """Short digest of the values' reprs, for caching on unhashable inputs like dicts"""
+    return hashlib.blake2b(repr(values).encode('utf-8'), digest_size=16).digest()
+
+# The custom storyboard viewer is looked up once, relative to the working directory
+_VIEWER_PATH = pathlib.Path('custom_storyboard_viewer.py')
+_HAS_VIEWER = _VIEWER_PATH.is_file()
 
 # Import display_images module if available
 try:
@@ -29,22 +45,353 @@ except ImportError:
         """Dummy function when storyboard is unavailable"""
         print("Storyboard viewing is not available on this system.")
 
+# A word together with its trailing whitespace, or a leading run of whitespace
+_TYPING_TOKEN = re.compile(r'\S+\s*|\s+')
+
+# Whether the Windows console accepts escape sequences; None until clear_screen first checks
+_windows_vt_mode = None
+
+def _enable_windows_vt_mode():
+    """Turn on VT escape processing in the Windows console, returning whether it is on"""
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    global _windows_vt_mode
+    if os.name == 'nt' and _windows_vt_mode is None:
+        _windows_vt_mode = _enable_windows_vt_mode()
+    
+    # Terminals without escape support still get the clear/cls command
+    if os.environ.get('TERM') == 'dumb' or _windows_vt_mode is False:
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
 
 def print_with_typing_effect(text, delay=0.03, variance=0.01):
     """Print text with a typewriter effect"""
-    import random
+    # Nothing to animate when output is piped or redirected
+    if not sys.stdout.isatty():
+        print(text)
+        return
     
-    for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        # Random variation in typing speed for natural effect
-        typing_delay = max(0.001, delay + random.uniform(-variance, variance))
-        time.sleep(typing_delay)
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    sleep = time.sleep
+    rand = random.random
+    
+    # Random variation in typing speed for natural effect, drawn up front
+    delays = [max(0.001, delay + (rand() * 2 - 1) * variance) for _ in text]
+    
+    # Type a word at a time, pausing for the combined delay of its characters
+    pos = 0
+    for token in _TYPING_TOKEN.findall(text):
+        end = pos + len(token)
+        write(token)
+        flush()
+        sleep(sum(delays[pos:end]))
+        pos = end
     print()
 
+@dataclass
+class RunConfig:
+    """Pre-set answers for run_custom_story_generator; any left as None are asked for"""
+    theme_name: str | None = None
+    theme_description: str | None = None
+    style_choice: str | None = None
+    location_choice: str | None = None
+    custom_location: str | None = None
+    season_choice: str | None = None
+    custom_season: str | None = None
+    period_choice: str | None = None
+    custom_period: str | None = None
+    char_creation_choice: str | None = None
+    num_chars: str | None = None
+    character_names: list[str] | None = None  # Standard creation only; "" generates a name
+    complexity_level: str | None = None
+    edit_choice: str | None = None
+    include_quote: str | None = None
+    quote_style_choice: str | None = None
+    next_choice: str | None = None
+    format_choice: str | None = None
+    filename: str | None = None
+    open_storyboard_after_save: str | None = None
+
+def _config_answer(value):
+    """Turn a JSON config value into the text a user would have typed"""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, list):
+        return [_config_answer(item) for item in value]
+    return value if value is None else str(value)
+
+# How many characters a custom story can have, whether asked for or named in a config
+_MIN_CHARACTERS = 2
+_MAX_CHARACTERS = 4
+
+def load_run_config(path=None):
+    """Load a RunConfig from a JSON file, by default the one named by $STORYTELLER_CONFIG"""
+    path = path or os.environ.get('STORYTELLER_CONFIG')
+    if not path:
+        return RunConfig()
+    
+    with open(path, 'rb') as f:
+        data = load_json(f.read())
+    known = {field.name for field in fields(RunConfig)}
+    unknown = data.keys() - known
+    if unknown:
+        raise ValueError(f"Unknown storyteller config keys: {', '.join(sorted(unknown))}")
+    config = RunConfig(**{key: _config_answer(value) for key, value in data.items()})
+    # Enhanced creation asks for each character's role and traits, which a config can't answer
+    if config.char_creation_choice == "2":
+        raise ValueError("Storyteller configs can't use enhanced character creation (char_creation_choice 2)")
+    names = config.character_names
+    if names is not None and not (
+        isinstance(names, list) and _MIN_CHARACTERS <= len(names) <= _MAX_CHARACTERS
+    ):
+        raise ValueError(
+            f"Storyteller config character_names must be a list of {_MIN_CHARACTERS} to "
+            f"{_MAX_CHARACTERS} names, not {names!r}"
+        )
+    return config
+
+def _ask(answer, prompt):
+    """Return a pre-set answer, or prompt for one"""
+    return input(prompt) if answer is None else answer
+
+def _parse_int(text):
+    """Parse a whole number with an optional sign, returning None for anything else"""
+    text = text.strip()
+    digits = text[1:] if text[:1] in ('+', '-') else text
+    return int(text) if digits.isdecimal() else None
+
+def _menu_choice(options, text):
+    """Return the option picked by a 1-based menu number, or None if the input isn't one"""
+    number = _parse_int(text)
+    if number is None or not 1 <= number <= len(options):
+        return None
+    return options[number - 1]
+
+def _prompt_clamped_int(prompt, low, high, default, invalid_message, answer=None):
+    """Prompt for a number clamped to [low, high], using default for non-numeric input"""
+    number = _parse_int(_ask(answer, prompt))
+    if number is None:
+        print(invalid_message)
+        return default
+    return max(low, min(high, number))
+
+def _read_text_until_done():
+    """Read lines up to a 'DONE' line into one string, or None if no lines came first"""
+    if sys.stdin.isatty():
+        # Interactive typing keeps input() for its line editing
+        lines = iter(input, None)
+    else:
+        # Piped input is consumed from stdin's own buffer, leaving later lines for the next prompts
+        lines = (line.rstrip("\n") for line in sys.stdin)
+    
+    text = io.StringIO()
+    separator = ""
+    for line in lines:
+        if line == "DONE":
+            break
+        text.write(separator)
+        text.write(line)
+        separator = "\n"
+    return text.getvalue() if separator else None
+
+# Narrative style templates for custom themes. Setting and theme fields are filled
+# in with str.format_map; the doubled braces survive as character placeholders.
+_STORY_STYLE_TEMPLATES = {
+    "classic": """
+In {season} of {time_period}, our story unfolds at {location}. The theme of our narrative centers around "{theme_name}".
+
+{theme_description}
+
+Our cast of characters includes:
+- {{protagonist_name}}: A {{protagonist_personality}} {{protagonist_social_class}} who serves as our central figure.
+- {{character1_name}}: A {{character1_personality}} {{character1_occupation}} who plays a significant role.
+- {{character2_name}}: A {{character2_personality}} individual known as {{character2_occupation}}.
+
+As expectations and personal desires intertwine, each character must navigate the complexities of their position while true natures are revealed through the course of events.
+
+The particular atmosphere of {season} at {location} colors the interactions, while the values of {time_period} provide both structure and challenge.
+
+Will our characters find resolution within the bounds of propriety, or will the heart's inclinations prove stronger than expectations?
+""",
+    "dramatic": """
+In the {season} of {time_period}, a most remarkable tale unfolds at {location}. The atmosphere is charged with anticipation as our narrative of "{theme_name}" commences.
+
+{theme_description}
+
+Amidst conflict and heightened emotions, our dramatis personae emerges:
+- {{protagonist_name}}: A {{protagonist_personality}} {{protagonist_social_class}} whose passionate nature drives our tale forward.
+- {{character1_name}}: A {{character1_personality}} {{character1_occupation}} harboring secrets that threaten the established order.
+- {{character2_name}}: A {{character2_personality}} individual serving as {{character2_occupation}}, whose loyalties remain to be tested.
+
+The constraints of society clash violently with the fervent desires of the heart. A tense atmosphere permeates every interaction, every meeting, every momentary connection between our characters.
+
+The oppressive weight of {time_period}'s expectations casts long shadows over {location}, particularly poignant in the {season} when all seems poised for dramatic transformation.
+
+What terrible sacrifices must be made? What cherished principles will be compromised? When personal passion confronts duty, what devastating choices await our characters?
+""",
+    "comedic": """
+The {season} at {location} during {time_period} brings with it a most amusing arrangement of circumstances. Our delightful tale of "{theme_name}" promises endless entertainment.
+
+{theme_description}
+
+Let us acquaint ourselves with the most colorful personalities of our comedy:
+- {{protagonist_name}}: A {{protagonist_personality}} {{protagonist_social_class}} whose well-meaning endeavors inevitably lead to the most charming of disasters.
+- {{character1_name}}: A {{character1_personality}} {{character1_occupation}} possessing an uncanny talent for appearing at precisely the wrong moment.
+- {{character2_name}}: A {{character2_personality}} individual employed as {{character2_occupation}}, dispensing wisdom that is consistently misinterpreted.
+
+Misunderstandings abound as messages are delivered to incorrect recipients, conversations are overheard but only in part, and social blunders are committed with the best of intentions.
+
+The particular quirks of {season} at {location} only add to the confusion, while the customs of {time_period} provide abundant opportunity for the most delightful of misapprehensions.
+
+Will our well-intentioned characters navigate this labyrinth of social errors? Or will their follies lead to unexpected but perfectly matched alliances of the heart?
+""",
+    "romantic": """
+The tender {season} air of {time_period} envelops {location} as our heart-stirring tale of "{theme_name}" begins its gentle unfolding.
+
+{theme_description}
+
+The affairs of the heart center around these souls yearning for connection:
+- {{protagonist_name}}: A {{protagonist_personality}} {{protagonist_social_class}} whose tender heart has known both joy and sorrow.
+- {{character1_name}}: A {{character1_personality}} {{character1_occupation}} whose mere presence causes a certain quickening of pulse.
+- {{character2_name}}: A {{character2_personality}} individual serving as {{character2_occupation}}, who understands the language of unspoken sentiments.
+
+Stolen glances across crowded rooms, hands briefly touching during fleeting moments, and walks where words fail but hearts speak volumes.
+
+The romantic atmosphere of {season} enhances the beauty of {location}, while the customs of {time_period} provide both sweet anticipation and agonizing restraint.
+
+When two souls recognize in each other something profound and true, what convention could possibly stand in the way of such a divine connection?
+""",
+    "mystery": """
+A shroud of intrigue descends upon {location} during the {season} of {time_period}. Our tale of "{theme_name}" conceals secrets within its every paragraph.
+
+{theme_description}
+
+The players in this game of secrets and half-truths include:
+- {{protagonist_name}}: A {{protagonist_personality}} {{protagonist_social_class}} with uncommonly keen powers of observation.
+- {{character1_name}}: A {{character1_personality}} {{character1_occupation}} whose past contains details that do not align with their present narrative.
+- {{character2_name}}: A {{character2_personality}} individual employed as {{character2_occupation}}, privy to conversations never meant for public discussion.
+
+Unexplained occurrences, missing items, unusual patterns of behavior, and conversations that cease abruptly when certain parties enter the room.
+
+The mists and shadows of {season} cloak {location} in an atmosphere of uncertainty, while the codes of {time_period} provide perfect cover for those with something to hide.
+
+What truths lie buried beneath the surface? When all is revealed, will anyone remain untouched by the revelations?
+"""
+}
+
+# Templates split into (literal, field) pairs once, so rendering skips format parsing
+_PARSED_STORY_STYLE_TEMPLATES = {
+    style: tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+    )
+    for style, template in _STORY_STYLE_TEMPLATES.items()
+}
+
+# Title banner for the custom storyteller, pre-encoded for direct writes to stdout
+_BANNER = """
+█████████████████████████████████████████████████████████████████████
+█                                                                 █
+█        JANE AUSTEN CUSTOM THEME STORYTELLING EXPERIENCE         █
+█                                                                 █
+█  "I declare after all there is no enjoyment like reading! How   █
+█   much sooner one tires of any thing than of a book!"           █
+█                                                                 █
+█████████████████████████████████████████████████████████████████████
+        """
+_BANNER_BYTES = (_BANNER + "\n").encode('utf-8')
+
+def _print_banner():
+    """Print the banner, writing the pre-encoded bytes directly when stdout is UTF-8"""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '')
+    if buffer is None or encoding != 'utf8':
+        print(_BANNER)
+        return
+    sys.stdout.flush()
+    buffer.write(_BANNER_BYTES)
+    buffer.flush()
+
+# Character role templates
+_ROLE_TEMPLATES = MappingProxyType({
+    "protagonist": {
+        "name": "Protagonist",
+        "description": "The central character of your story"
+    },
+    "confidant": {
+        "name": "Confidant/Friend",
+        "description": "A trusted friend or family member"
+    },
+    "romantic_interest": {
+        "name": "Romantic Interest",
+        "description": "A potential or established love interest"
+    },
+    "rival": {
+        "name": "Rival/Antagonist",
+        "description": "Someone who opposes or creates conflict"
+    },
+    "mentor": {
+        "name": "Mentor/Guardian",
+        "description": "An older, wiser guide"
+    },
+    "comic_relief": {
+        "name": "Comic Relief",
+        "description": "A humorous or eccentric character"
+    }
+})
+
+# Virtues and flaws - typical of Austen characters
+_VIRTUES = (
+    "honesty", "compassion", "intelligence", "wit", "propriety", 
+    "loyalty", "prudence", "resilience", "patience", "modesty",
+    "temperance", "kindness", "generosity", "humility", "diligence"
+)
+
+_FLAWS = (
+    "pride", "prejudice", "vanity", "impetuousness", "insecurity",
+    "jealousy", "stubbornness", "naivety", "imprudence", "gossip",
+    "snobbery", "excessive sensibility", "indiscretion", "selfishness", 
+    "quick temper"
+)
+
+# Personal goals common in Austen's works
+_PERSONAL_GOALS = (
+    "securing a favorable marriage", 
+    "maintaining family reputation",
+    "achieving financial security",
+    "pursuing intellectual growth",
+    "finding true companionship",
+    "advancing in society",
+    "preserving family estate",
+    "breaking free of social constraints",
+    "reconciling personal desires with duty",
+    "proving oneself worthy of esteem"
+)
+
+# Traditional setting options offered alongside custom ones
+_LOCATIONS = (
+    "Pemberley", "Longbourn", "Netherfield Park", 
+    "Mansfield Park", "Kellynch Hall", "Bath", "London"
+)
+_SEASONS = ("spring", "summer", "autumn", "winter")
+_TIME_PERIODS = (
+    "the early Regency era", 
+    "the height of the Regency period",
+    "the late Regency era", 
+    "the year 1810",
+    "the aftermath of the Napoleonic Wars"
+)
+
 class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
     """Extended story generator that allows for custom themes"""
     
@@ -56,6 +403,15 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
         self.custom_themes = []
         self.custom_settings = {}
         
+        # Rendered custom templates, keyed on every input that shapes them
+        self._template_cache = {}
+        
+        # Rendered character portraits, keyed on the character's contents
+        self._portrait_cache = {}
+        
+        # Story timelines, keyed on a digest of the story, characters and settings
+        self._timeline_cache = {}
+        
     def add_custom_theme(self, theme_name, theme_description):
         """Add a custom theme with description"""
         self.custom_themes.append({
@@ -64,6 +420,28 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
         })
         return len(self.custom_themes) - 1  # Return the index of the added theme
         
+    def generate_character_portrait(self, character):
+        """Generate a text-based portrait for a character, reusing one already drawn"""
+        key = _content_key(sorted(character.items()))
+        portrait = self._portrait_cache.get(key)
+        if portrait is None:
+            portrait = super().generate_character_portrait(character)
+            self._portrait_cache[key] = portrait
+        return portrait
+        
+    def generate_story_timeline(self, story, characters, settings):
+        """Generate a visual timeline of events in the story, reusing one for an unchanged story"""
+        key = _content_key(
+            story,
+            [sorted(character.items()) for character in characters],
+            sorted(settings.items())
+        )
+        timeline = self._timeline_cache.get(key)
+        if timeline is None:
+            timeline = super().generate_story_timeline(story, characters, settings)
+            self._timeline_cache[key] = timeline
+        return timeline
+        
     def _open_custom_storyboard(self, theme, characters, settings, story):
         """
         Open a custom storyboard for the generated story.
@@ -77,36 +455,35 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
             story: The generated or edited story text
         """
         # Create a temporary file with story data for the custom storyboard viewer
-        import json
-        import os
-        
         # Prepare story data
         story_data = {
             "theme": theme,
             "characters": characters,
             "settings": settings,
             "story_text": story,
-            "timestamp": import_time.strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         
         # Create temp directory if it doesn't exist
-        if not os.path.exists('temp'):
-            os.makedirs('temp')
+        os.makedirs('temp', exist_ok=True)
             
         # Save story data to a temporary JSON file
         temp_file = os.path.join('temp', 'storyboard_data.json')
-        with open(temp_file, 'w') as f:
-            json.dump(story_data, f, indent=2)
+        with open_atomic(temp_file, 'wb') as file:
+            file.write(dump_story_json(story_data))
             
         print(f"\nStory data saved to {temp_file}")
         print("Redirecting to custom storyboard viewer...")
         
         try:
             # Check if the custom storyboard viewer exists
-            if os.path.exists('custom_storyboard_viewer.py'):
-                # Use subprocess to run the viewer
-                import subprocess
-                subprocess.Popen(['python', 'custom_storyboard_viewer.py'])
+            if _HAS_VIEWER:
+                # Launch with this interpreter, passing the data path on argv
+                command = [sys.executable, str(_VIEWER_PATH), temp_file]
+                if os.name == 'nt':
+                    subprocess.Popen(command, creationflags=subprocess.DETACHED_PROCESS)
+                else:
+                    subprocess.Popen(command)
                 print("\nCustom storyboard viewer launched.")
                 print("You can create 'custom_storyboard_viewer.py' to implement your own viewer.")
             else:
@@ -129,71 +506,17 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
         print("\nEnhanced Character Creation")
         print("This mode allows you to craft more nuanced characters with specific traits.")
         
-        num_characters = input("How many characters would you like to create? (2-4): ")
-        try:
-            num_chars = int(num_characters)
-            num_chars = max(2, min(4, num_chars))  # Ensure between 2-4
-        except ValueError:
-            print("Invalid input. Defaulting to 3 characters.")
-            num_chars = 3
+        num_chars = _prompt_clamped_int(
+            "How many characters would you like to create? (2-4): ", _MIN_CHARACTERS, _MAX_CHARACTERS,
+            3, "Invalid input. Defaulting to 3 characters."
+        )
             
         characters = []
         
-        # Define character role templates
-        role_templates = {
-            "protagonist": {
-                "name": "Protagonist",
-                "description": "The central character of your story"
-            },
-            "confidant": {
-                "name": "Confidant/Friend",
-                "description": "A trusted friend or family member"
-            },
-            "romantic_interest": {
-                "name": "Romantic Interest",
-                "description": "A potential or established love interest"
-            },
-            "rival": {
-                "name": "Rival/Antagonist",
-                "description": "Someone who opposes or creates conflict"
-            },
-            "mentor": {
-                "name": "Mentor/Guardian",
-                "description": "An older, wiser guide"
-            },
-            "comic_relief": {
-                "name": "Comic Relief",
-                "description": "A humorous or eccentric character"
-            }
-        }
-        
-        # Virtues and flaws - typical of Austen characters
-        virtues = [
-            "honesty", "compassion", "intelligence", "wit", "propriety", 
-            "loyalty", "prudence", "resilience", "patience", "modesty",
-            "temperance", "kindness", "generosity", "humility", "diligence"
-        ]
-        
-        flaws = [
-            "pride", "prejudice", "vanity", "impetuousness", "insecurity",
-            "jealousy", "stubbornness", "naivety", "imprudence", "gossip",
-            "snobbery", "excessive sensibility", "indiscretion", "selfishness", 
-            "quick temper"
-        ]
-        
-        # Personal goals common in Austen's works
-        personal_goals = [
-            "securing a favorable marriage", 
-            "maintaining family reputation",
-            "achieving financial security",
-            "pursuing intellectual growth",
-            "finding true companionship",
-            "advancing in society",
-            "preserving family estate",
-            "breaking free of social constraints",
-            "reconciling personal desires with duty",
-            "proving oneself worthy of esteem"
-        ]
+        # Random fallbacks for invalid virtue/flaw/goal selections, drawn in one batch
+        fallback_virtues = random.choices(_VIRTUES, k=num_chars)
+        fallback_flaws = random.choices(_FLAWS, k=num_chars)
+        fallback_goals = random.choices(_PERSONAL_GOALS, k=num_chars)
         
         # Create each character with enhanced traits
         for i in range(num_chars):
@@ -215,25 +538,27 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
                     role = "rival"
                 else:
                     role = "confidant"
-                role_name = role_templates[role]["name"]
+                role_name = _ROLE_TEMPLATES[role]["name"]
             else:
                 print("\nSelect a role for this character:")
-                available_roles = list(role_templates.keys())
+                available_roles = list(_ROLE_TEMPLATES.keys())
                 # Remove protagonist as an option for non-first characters
                 if "protagonist" in available_roles and i > 0:
                     available_roles.remove("protagonist")
                 
-                for j, role_key in enumerate(available_roles, 1):
-                    print(f"{j}. {role_templates[role_key]['name']} - {role_templates[role_key]['description']}")
+                print_menu(
+                    f"{_ROLE_TEMPLATES[role_key]['name']} - {_ROLE_TEMPLATES[role_key]['description']}"
+                    for role_key in available_roles
+                )
                 
                 role_idx = input(f"Select role (1-{len(available_roles)}): ")
-                try:
-                    role = available_roles[int(role_idx)-1]
-                    role_name = role_templates[role]["name"]
-                except (ValueError, IndexError):
+                role = _menu_choice(available_roles, role_idx)
+                if role is not None:
+                    role_name = _ROLE_TEMPLATES[role]["name"]
+                else:
                     # Default to confidant if invalid selection
                     role = "confidant" if i != 0 else "protagonist"
-                    role_name = role_templates[role]["name"]
+                    role_name = _ROLE_TEMPLATES[role]["name"]
                     print(f"Invalid selection. Defaulting to {role_name}.")
             
             # Get custom name or generate one
@@ -275,63 +600,58 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
             
             # Add the role to the character
             character['role'] = role_name
+            char_name = character['name']
             
             # Let user select character virtues
-            print(f"\nSelect a primary virtue for {character['name']}:")
-            for j, virtue in enumerate(virtues[:10], 1):  # Show first 10 virtues
-                print(f"{j}. {virtue.capitalize()}")
+            print(f"\nSelect a primary virtue for {char_name}:")
+            print_menu(virtue.capitalize() for virtue in _VIRTUES[:10])  # Show first 10 virtues
             print("11. Other/Custom")
             
             virtue_choice = input("Select virtue (1-11): ")
             if virtue_choice == "11":
-                character['virtue'] = input("Enter custom virtue: ").lower()
+                virtue = input("Enter custom virtue: ").lower()
             else:
-                try:
-                    virtue_idx = int(virtue_choice) - 1
-                    character['virtue'] = virtues[virtue_idx]
-                except (ValueError, IndexError):
+                virtue = _menu_choice(_VIRTUES, virtue_choice)
+                if virtue is None:
                     # Choose random virtue if invalid selection
-                    character['virtue'] = random.choice(virtues)
-                    print(f"Invalid selection. Assigned virtue: {character['virtue'].capitalize()}")
+                    virtue = fallback_virtues[i]
+                    print(f"Invalid selection. Assigned virtue: {virtue.capitalize()}")
+            character['virtue'] = virtue
             
             # Let user select character flaws
-            print(f"\nSelect a primary flaw for {character['name']}:")
-            for j, flaw in enumerate(flaws[:10], 1):  # Show first 10 flaws
-                print(f"{j}. {flaw.capitalize()}")
+            print(f"\nSelect a primary flaw for {char_name}:")
+            print_menu(flaw.capitalize() for flaw in _FLAWS[:10])  # Show first 10 flaws
             print("11. Other/Custom")
             
             flaw_choice = input("Select flaw (1-11): ")
             if flaw_choice == "11":
-                character['flaw'] = input("Enter custom flaw: ").lower()
+                flaw = input("Enter custom flaw: ").lower()
             else:
-                try:
-                    flaw_idx = int(flaw_choice) - 1
-                    character['flaw'] = flaws[flaw_idx]
-                except (ValueError, IndexError):
+                flaw = _menu_choice(_FLAWS, flaw_choice)
+                if flaw is None:
                     # Choose random flaw if invalid selection
-                    character['flaw'] = random.choice(flaws)
-                    print(f"Invalid selection. Assigned flaw: {character['flaw'].capitalize()}")
+                    flaw = fallback_flaws[i]
+                    print(f"Invalid selection. Assigned flaw: {flaw.capitalize()}")
+            character['flaw'] = flaw
             
             # Let user select personal goal
-            print(f"\nSelect a personal goal for {character['name']}:")
-            for j, goal in enumerate(personal_goals, 1):
-                print(f"{j}. {goal.capitalize()}")
-            print(f"{len(personal_goals)+1}. Other/Custom")
-            
-            goal_choice = input(f"Select goal (1-{len(personal_goals)+1}): ")
-            if goal_choice == str(len(personal_goals)+1):
-                character['goal'] = input("Enter custom goal: ")
+            print(f"\nSelect a personal goal for {char_name}:")
+            print_menu(goal.capitalize() for goal in _PERSONAL_GOALS)
+            print(f"{len(_PERSONAL_GOALS)+1}. Other/Custom")
+            
+            goal_choice = input(f"Select goal (1-{len(_PERSONAL_GOALS)+1}): ")
+            if goal_choice == str(len(_PERSONAL_GOALS)+1):
+                goal = input("Enter custom goal: ")
             else:
-                try:
-                    goal_idx = int(goal_choice) - 1
-                    character['goal'] = personal_goals[goal_idx]
-                except (ValueError, IndexError):
+                goal = _menu_choice(_PERSONAL_GOALS, goal_choice)
+                if goal is None:
                     # Choose random goal if invalid selection
-                    character['goal'] = random.choice(personal_goals)
-                    print(f"Invalid selection. Assigned goal: {character['goal']}")
+                    goal = fallback_goals[i]
+                    print(f"Invalid selection. Assigned goal: {goal}")
+            character['goal'] = goal
             
             # Custom backstory option
-            backstory_choice = input(f"\nWould you like to provide a custom backstory for {character['name']}? (yes/no): ")
+            backstory_choice = input(f"\nWould you like to provide a custom backstory for {char_name}? (yes/no): ")
             if backstory_choice.lower().startswith('y'):
                 character['backstory'] = input("Enter backstory: ")
                 
@@ -340,15 +660,15 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
             
             # Display character summary
             print(f"\nCharacter {i+1} Summary:")
-            print(f"Name: {character['name']}")
-            print(f"Role: {character['role']}")
+            print(f"Name: {char_name}")
+            print(f"Role: {role_name}")
             print(f"Gender: {character['gender']}")
             print(f"Social Class: {character['social_class']}")
             print(f"Occupation: {character['occupation']}")
             print(f"Personality: {character['personality']}")
-            print(f"Primary Virtue: {character['virtue'].capitalize()}")
-            print(f"Primary Flaw: {character['flaw'].capitalize()}")
-            print(f"Personal Goal: {character['goal']}")
+            print(f"Primary Virtue: {virtue.capitalize()}")
+            print(f"Primary Flaw: {flaw.capitalize()}")
+            print(f"Personal Goal: {goal}")
             if 'backstory' in character:
                 print(f"Backstory: {character['backstory']}")
                 
@@ -380,124 +700,49 @@ class CustomThemeStoryGenerator(JaneAustenStoryGenerator):
         season = settings.get('season', 'this time')
         time_period = settings.get('time_period', 'this era')
         
-        # Create the appropriate template based on style
-        if template_style == "dramatic":
-            template = f"""
-In the {season} of {time_period}, a most remarkable tale unfolds at {location}. The atmosphere is charged with anticipation as our narrative of "{theme_name}" commences.
-
-{theme_description}
-
-Amidst conflict and heightened emotions, our dramatis personae emerges:
-- {'{protagonist_name}'}: A {'{protagonist_personality}'} {'{protagonist_social_class}'} whose passionate nature drives our tale forward.
-- {'{character1_name}'}: A {'{character1_personality}'} {'{character1_occupation}'} harboring secrets that threaten the established order.
-- {'{character2_name}'}: A {'{character2_personality}'} individual serving as {'{character2_occupation}'}, whose loyalties remain to be tested.
-
-The constraints of society clash violently with the fervent desires of the heart. A tense atmosphere permeates every interaction, every meeting, every momentary connection between our characters.
-
-The oppressive weight of {time_period}'s expectations casts long shadows over {location}, particularly poignant in the {season} when all seems poised for dramatic transformation.
-
-What terrible sacrifices must be made? What cherished principles will be compromised? When personal passion confronts duty, what devastating choices await our characters?
-"""
-
-        elif template_style == "comedic":
-            template = f"""
-The {season} at {location} during {time_period} brings with it a most amusing arrangement of circumstances. Our delightful tale of "{theme_name}" promises endless entertainment.
-
-{theme_description}
-
-Let us acquaint ourselves with the most colorful personalities of our comedy:
-- {'{protagonist_name}'}: A {'{protagonist_personality}'} {'{protagonist_social_class}'} whose well-meaning endeavors inevitably lead to the most charming of disasters.
-- {'{character1_name}'}: A {'{character1_personality}'} {'{character1_occupation}'} possessing an uncanny talent for appearing at precisely the wrong moment.
-- {'{character2_name}'}: A {'{character2_personality}'} individual employed as {'{character2_occupation}'}, dispensing wisdom that is consistently misinterpreted.
-
-Misunderstandings abound as messages are delivered to incorrect recipients, conversations are overheard but only in part, and social blunders are committed with the best of intentions.
-
-The particular quirks of {season} at {location} only add to the confusion, while the customs of {time_period} provide abundant opportunity for the most delightful of misapprehensions.
-
-Will our well-intentioned characters navigate this labyrinth of social errors? Or will their follies lead to unexpected but perfectly matched alliances of the heart?
-"""
-
-        elif template_style == "romantic":
-            template = f"""
-The tender {season} air of {time_period} envelops {location} as our heart-stirring tale of "{theme_name}" begins its gentle unfolding.
-
-{theme_description}
-
-The affairs of the heart center around these souls yearning for connection:
-- {'{protagonist_name}'}: A {'{protagonist_personality}'} {'{protagonist_social_class}'} whose tender heart has known both joy and sorrow.
-- {'{character1_name}'}: A {'{character1_personality}'} {'{character1_occupation}'} whose mere presence causes a certain quickening of pulse.
-- {'{character2_name}'}: A {'{character2_personality}'} individual serving as {'{character2_occupation}'}, who understands the language of unspoken sentiments.
-
-Stolen glances across crowded rooms, hands briefly touching during fleeting moments, and walks where words fail but hearts speak volumes.
-
-The romantic atmosphere of {season} enhances the beauty of {location}, while the customs of {time_period} provide both sweet anticipation and agonizing restraint.
-
-When two souls recognize in each other something profound and true, what convention could possibly stand in the way of such a divine connection?
-"""
-
-        elif template_style == "mystery":
-            template = f"""
-A shroud of intrigue descends upon {location} during the {season} of {time_period}. Our tale of "{theme_name}" conceals secrets within its every paragraph.
-
-{theme_description}
-
-The players in this game of secrets and half-truths include:
-- {'{protagonist_name}'}: A {'{protagonist_personality}'} {'{protagonist_social_class}'} with uncommonly keen powers of observation.
-- {'{character1_name}'}: A {'{character1_personality}'} {'{character1_occupation}'} whose past contains details that do not align with their present narrative.
-- {'{character2_name}'}: A {'{character2_personality}'} individual employed as {'{character2_occupation}'}, privy to conversations never meant for public discussion.
-
-Unexplained occurrences, missing items, unusual patterns of behavior, and conversations that cease abruptly when certain parties enter the room.
-
-The mists and shadows of {season} cloak {location} in an atmosphere of uncertainty, while the codes of {time_period} provide perfect cover for those with something to hide.
-
-What truths lie buried beneath the surface? When all is revealed, will anyone remain untouched by the revelations?
-"""
-
-        # Default classic style
-        else:
-            template = f"""
-In {season} of {time_period}, our story unfolds at {location}. The theme of our narrative centers around "{theme_name}".
-
-{theme_description}
-
-Our cast of characters includes:
-- {'{protagonist_name}'}: A {'{protagonist_personality}'} {'{protagonist_social_class}'} who serves as our central figure.
-- {'{character1_name}'}: A {'{character1_personality}'} {'{character1_occupation}'} who plays a significant role.
-- {'{character2_name}'}: A {'{character2_personality}'} individual known as {'{character2_occupation}'}.
-
-As expectations and personal desires intertwine, each character must navigate the complexities of their position while true natures are revealed through the course of events.
-
-The particular atmosphere of {season} at {location} colors the interactions, while the values of {time_period} provide both structure and challenge.
-
-Will our characters find resolution within the bounds of propriety, or will the heart's inclinations prove stronger than expectations?
-"""
+        # Reuse the template if this theme, style and setting were rendered before
+        cache_key = (theme_name, theme_description, template_style, location, season, time_period)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Fill the chosen style's pre-parsed template, defaulting to classic
+        parts = _PARSED_STORY_STYLE_TEMPLATES.get(
+            template_style, _PARSED_STORY_STYLE_TEMPLATES["classic"]
+        )
+        context = {
+            'location': location,
+            'season': season,
+            'time_period': time_period,
+            'theme_name': theme_name,
+            'theme_description': theme_description
+        }
+        template = "".join(
+            literal + str(context[field]) if field is not None else literal
+            for literal, field in parts
+        )
+        self._template_cache[cache_key] = template
         return template
         
-    def run_custom_story_generator(self):
-        """Main workflow for generating stories with custom themes"""
+    def run_custom_story_generator(self, config=None):
+        """Main workflow for generating stories with custom themes, optionally driven by a RunConfig"""
+        if config is None:
+            config = load_run_config()
+        
         clear_screen()
         
-        print("""
-█████████████████████████████████████████████████████████████████████
-█                                                                 █
-█        JANE AUSTEN CUSTOM THEME STORYTELLING EXPERIENCE         █
-█                                                                 █
-█  "I declare after all there is no enjoyment like reading! How   █
-█   much sooner one tires of any thing than of a book!"           █
-█                                                                 █
-█████████████████████████████████████████████████████████████████████
-        """)
+        _print_banner()
         
         # Get custom theme from user with unlimited possibilities
         print("\n✨ CREATE YOUR OWN JANE AUSTEN STORY ON ANY THEME ✨")
         print("This storyteller allows you to craft a tale on absolutely any theme you wish.")
         print("Your imagination is the only limit - be it historical, magical, philosophical, or anything else!")
         
-        theme_name = input("\nEnter ANY theme title for your story: ")
+        theme_name = _ask(config.theme_name, "\nEnter ANY theme title for your story: ")
         
         print("\nNow, share a brief description of your theme:")
         print("(Feel free to be as creative, unconventional, or imaginative as you like)")
-        theme_description = input("\nTheme description: ")
+        theme_description = _ask(config.theme_description, "\nTheme description: ")
         
         # Select narrative style
         print("\nSelect a narrative style for your story:")
@@ -507,7 +752,7 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("4. Romantic (focus on matters of the heart)")
         print("5. Mystery (secrets and intrigue)")
         
-        style_choice = input("\nEnter style choice (1-5): ")
+        style_choice = _ask(config.style_choice, "\nEnter style choice (1-5): ")
         
         # Map the choice to a style name
         style_mapping = {
@@ -533,37 +778,20 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("\nNow, let's create a setting for your story:")
         print("You can choose from traditional Austen-era settings or create any setting imaginable!")
         
-        # Define traditional options for those who want them
-        locations = [
-            "Pemberley", "Longbourn", "Netherfield Park", 
-            "Mansfield Park", "Kellynch Hall", "Bath", "London"
-        ]
-        seasons = ["spring", "summer", "autumn", "winter"]
-        time_periods = [
-            "the early Regency era", 
-            "the height of the Regency period",
-            "the late Regency era", 
-            "the year 1810",
-            "the aftermath of the Napoleonic Wars"
-        ]
-        
         # Location selection with custom option prominently featured
         print("\n📍 LOCATION:")
         print("You can select a traditional Austen location or create your own unique setting.")
         print("Traditional locations:")
-        for i, location in enumerate(locations, 1):
-            print(f"{i}. {location}")
+        print_menu(_LOCATIONS)
         print("0. Create your own location (anywhere real or imaginary)")
         
-        location_choice = input("\nEnter your choice (0-7): ")
+        location_choice = _ask(config.location_choice, "\nEnter your choice (0-7): ")
         
         if location_choice == "0":
-            selected_location = input("Enter the name of your location: ")
+            selected_location = _ask(config.custom_location, "Enter the name of your location: ")
         else:
-            try:
-                location_idx = int(location_choice) - 1
-                selected_location = locations[location_idx]
-            except (ValueError, IndexError):
+            selected_location = _menu_choice(_LOCATIONS, location_choice)
+            if selected_location is None:
                 # User entered something else, treat as custom location
                 selected_location = location_choice
         
@@ -573,19 +801,16 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("\n🌤️ SEASON/ATMOSPHERE:")
         print("You can choose a traditional season or describe any atmosphere for your setting.")
         print("Traditional seasons:")
-        for i, season in enumerate(seasons, 1):
-            print(f"{i}. {season}")
+        print_menu(_SEASONS)
         print("0. Create your own atmospheric condition")
         
-        season_choice = input("\nEnter your choice (0-4): ")
+        season_choice = _ask(config.season_choice, "\nEnter your choice (0-4): ")
         
         if season_choice == "0":
-            selected_season = input("Describe the atmosphere or seasonal condition: ")
+            selected_season = _ask(config.custom_season, "Describe the atmosphere or seasonal condition: ")
         else:
-            try:
-                season_idx = int(season_choice) - 1
-                selected_season = seasons[season_idx]
-            except (ValueError, IndexError):
+            selected_season = _menu_choice(_SEASONS, season_choice)
+            if selected_season is None:
                 # Default to spring if invalid but not custom
                 print("Invalid selection. Defaulting to spring.")
                 selected_season = "spring"
@@ -596,19 +821,16 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("\n⏳ TIME PERIOD:")
         print("You can select a traditional Austen-era time period or create any time period of your choosing.")
         print("Traditional time periods:")
-        for i, period in enumerate(time_periods, 1):
-            print(f"{i}. {period}")
+        print_menu(_TIME_PERIODS)
         print("0. Create your own time period (any era, real or imaginary)")
         
-        period_choice = input("\nEnter your choice (0-5): ")
+        period_choice = _ask(config.period_choice, "\nEnter your choice (0-5): ")
         
         if period_choice == "0":
-            selected_period = input("Enter your desired time period: ")
+            selected_period = _ask(config.custom_period, "Enter your desired time period: ")
         else:
-            try:
-                period_idx = int(period_choice) - 1
-                selected_period = time_periods[period_idx]
-            except (ValueError, IndexError):
+            selected_period = _menu_choice(_TIME_PERIODS, period_choice)
+            if selected_period is None:
                 # User entered something else, treat as custom time period
                 selected_period = period_choice if period_choice else "the Regency era"
         
@@ -627,28 +849,28 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("1. Standard (quick character generation)")
         print("2. Enhanced (more detailed character traits and backstories)")
         
-        char_creation_choice = input("\nEnter your choice (1-2): ")
+        char_creation_choice = _ask(config.char_creation_choice, "\nEnter your choice (1-2): ")
         enhanced_characters = char_creation_choice == "2"
         
         if enhanced_characters:
             characters = self.create_enhanced_characters()
+        elif config.character_names is not None:
+            characters = [
+                self.create_character(custom_name=name or None) for name in config.character_names
+            ]
         else:
-            num_characters = input("How many characters would you like to create? (2-4): ")
-            
-            try:
-                num_chars = int(num_characters)
-                num_chars = max(2, min(4, num_chars))  # Ensure between 2-4
-            except ValueError:
-                print("Invalid input. Defaulting to 3 characters.")
-                num_chars = 3
-                
+            num_chars = _prompt_clamped_int(
+                "How many characters would you like to create? (2-4): ", _MIN_CHARACTERS, _MAX_CHARACTERS,
+                3, "Invalid input. Defaulting to 3 characters.", config.num_chars
+            )
+            
             characters = self.create_characters(num_chars)
         
         # Generate a template for the custom theme using the selected style
         template = self.generate_custom_story_template(custom_theme, settings, custom_theme.get('style', 'classic'))
         
-        # Add the template to the story_templates dict temporarily
-        self.story_templates[custom_theme['name']] = template
+        # Register the template under its own namespace, leaving any built-in theme of the same name intact
+        self.story_templates[f"{CUSTOM_TEMPLATE_PREFIX}{custom_theme['name']}"] = template
         
         # Generate complexity level
         print("\nSelect storytelling complexity level:")
@@ -656,13 +878,10 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("2. Moderate complexity with some literary embellishments")
         print("3. Complex narrative with rich details and Austen-like prose")
         
-        complexity_choice = input("\nEnter complexity level (1-3): ")
-        try:
-            complexity_level = int(complexity_choice)
-            complexity_level = max(1, min(3, complexity_level))  # Ensure between 1-3
-        except ValueError:
-            print("Invalid selection. Defaulting to moderate complexity.")
-            complexity_level = 2
+        complexity_level = _prompt_clamped_int(
+            "\nEnter complexity level (1-3): ", 1, 3,
+            2, "Invalid selection. Defaulting to moderate complexity.", config.complexity_level
+        )
             
         print(f"\nGenerated story will use complexity level {complexity_level}.")
             
@@ -672,7 +891,7 @@ Will our characters find resolution within the bounds of propriety, or will the
         
         # Allow user to edit the storyline
         print("\nYour initial story has been generated. Would you like to edit it before continuing?")
-        edit_choice = input("Edit story? (yes/no): ").lower()
+        edit_choice = _ask(config.edit_choice, "Edit story? (yes/no): ").lower()
         
         if edit_choice.startswith('y'):
             print("\n=== STORY EDITING MODE ===")
@@ -682,15 +901,10 @@ Will our characters find resolution within the bounds of propriety, or will the
             print(initial_story)
             print("\n--- ENTER YOUR EDITED VERSION BELOW ---\n")
             
-            edited_lines = []
-            while True:
-                line = input()
-                if line == "DONE":
-                    break
-                edited_lines.append(line)
+            edited_story = _read_text_until_done()
             
-            if edited_lines:
-                story = "\n".join(edited_lines)
+            if edited_story is not None:
+                story = edited_story
                 print("\nStory has been updated with your edits.")
             else:
                 story = initial_story
@@ -700,7 +914,10 @@ Will our characters find resolution within the bounds of propriety, or will the
             print("\nContinuing with the generated story.")
         
         # Ask about including a Jane Austen quote
-        include_quote = input("\nWould you like to include a thematic Jane Austen quote with your story? (yes/no): ").lower().startswith('y')
+        include_quote = _ask(
+            config.include_quote,
+            "\nWould you like to include a thematic Jane Austen quote with your story? (yes/no): "
+        ).lower().startswith('y')
         
         # Add thematic quote if requested
         if include_quote:
@@ -710,7 +927,7 @@ Will our characters find resolution within the bounds of propriety, or will the
             print("2. Themed frame (based on quote theme)")
             print("3. Animated display (text appears letter by letter)")
             
-            style_choice = input("Enter choice (1-3): ")
+            style_choice = _ask(config.quote_style_choice, "Enter choice (1-3): ")
             
             # Determine quote style based on user choice
             if style_choice == "2":
@@ -724,7 +941,7 @@ Will our characters find resolution within the bounds of propriety, or will the
             story_with_quote = self.add_thematic_quote(story, quote_style=quote_style)
             
             # Special handling for animated quotes
-            if quote_style == "animated" and hasattr(self, 'last_quote'):
+            if quote_style == "animated":
                 # We'll animate the quote during display later
                 self.will_animate_quote = True
             else:
@@ -743,7 +960,7 @@ Will our characters find resolution within the bounds of propriety, or will the
         print("\nYOUR CUSTOM JANE AUSTEN STORY:\n")
         
         # Handle animated quotes differently
-        if hasattr(self, 'will_animate_quote') and self.will_animate_quote and hasattr(self, 'last_quote') and self.last_quote:
+        if self.will_animate_quote and self.last_quote:
             # Print the story without the quote (which will be animated)
             print(story)
             
@@ -770,9 +987,10 @@ Will our characters find resolution within the bounds of propriety, or will the
         
         # Display character portraits
         print("\nCHARACTER PORTRAITS:")
-        for character in characters:
-            print(self.generate_character_portrait(character))
-            print()
+        sys.stdout.write("".join(
+            f"{self.generate_character_portrait(character)}\n\n" for character in characters
+        ))
+        sys.stdout.flush()
             
         print("\n" + "="*80)
         
@@ -792,26 +1010,23 @@ Will our characters find resolution within the bounds of propriety, or will the
         else:
             print("3. Return to main menu")
             
-        choice = input("\nEnter your choice: ")
+        choice = _ask(config.next_choice, "\nEnter your choice: ")
         
         if choice == '1':
             # Save story option
             format_types = ['txt', 'json', 'html']
             
             print("\nAvailable formats:")
-            for i, format_type in enumerate(format_types, 1):
-                print(f"{i}. {format_type}")
+            print_menu(format_types)
                 
-            format_choice = input("\nSelect a format number: ")
+            format_choice = _ask(config.format_choice, "\nSelect a format number: ")
             
-            try:
-                format_idx = int(format_choice) - 1
-                selected_format = format_types[format_idx]
-            except (ValueError, IndexError):
+            selected_format = _menu_choice(format_types, format_choice)
+            if selected_format is None:
                 print("Invalid selection. Defaulting to txt format.")
                 selected_format = "txt"
                 
-            custom_filename = input("\nEnter a filename (or press Enter for auto-generated): ")
+            custom_filename = _ask(config.filename, "\nEnter a filename (or press Enter for auto-generated): ")
             # Use the version with quote if quote was added
             story_to_save = story_with_quote if include_quote else story
             
@@ -822,7 +1037,10 @@ Will our characters find resolution within the bounds of propriety, or will the
                 
             # After saving, ask if they want to do something else
             print("\nStory saved successfully!")
-            next_action = input("\nWould you like to open the custom storyboard? (yes/no): ")
+            next_action = _ask(
+                config.open_storyboard_after_save,
+                "\nWould you like to open the custom storyboard? (yes/no): "
+            )
             
             if next_action.lower().startswith('y'):
                 # Redirect to custom storyboard
@@ -7,25 +7,52 @@ displays it in a visual format.
 """
 
 import os
-import json
-import tkinter as tk
-from tkinter import ttk, scrolledtext
-from tkinter import messagebox
-from tkinter import font as tkfont
+import textwrap
+
+# The JSON parser and tkinter modules are imported where they are first used, so the
+# no-data path of main() never loads Tk
+
+# Characters per line of the theme description (about 800px in Georgia 11)
+_DESCRIPTION_WIDTH = 100
+
+# Characters inserted into the story text per idle callback
+_INSERT_CHUNK = 4096
+
+
+def _chunked_insert(text_widget, content, start=0, chunk=_INSERT_CHUNK):
+    """Insert content into a read-only text widget a chunk at a time, so Tk stays responsive
+
+    The widget is only editable during each insert, so keypresses between chunks can't
+    change the text or where the remaining chunks land.
+    """
+    text_widget.config(state="normal")
+    text_widget.insert("end", content[start:start + chunk])
+    text_widget.config(state="disabled")  # Read-only
+    if start + chunk < len(content):
+        text_widget.after_idle(_chunked_insert, text_widget, content, start + chunk, chunk)
+
 
 class DisplayImages:
+    # ttk styles are shared by every DisplayImages on a root, so configure them once
+    _styled_root = None
+    
     def __init__(self, root, story_data):
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.root = root
         self.story_data = story_data
         self.root.title(f"Story Visualization: {story_data['theme']['name']}")
         self.root.geometry("900x700")
         
-        # Configure style
+        # Configure style, once per root window
         self.style = ttk.Style()
-        self.style.configure("TLabel", font=("Georgia", 11))
-        self.style.configure("Header.TLabel", font=("Georgia", 16, "bold"))
-        self.style.configure("Subhead.TLabel", font=("Georgia", 14))
-        self.style.configure("Title.TLabel", font=("Georgia", 20, "bold"))
+        if DisplayImages._styled_root is not root:
+            self.style.configure("TLabel", font=("Georgia", 11))
+            self.style.configure("Header.TLabel", font=("Georgia", 16, "bold"))
+            self.style.configure("Subhead.TLabel", font=("Georgia", 14))
+            self.style.configure("Title.TLabel", font=("Georgia", 20, "bold"))
+            DisplayImages._styled_root = root
         
         # Create the main container
         self.main_frame = ttk.Frame(self.root, padding="20")
@@ -35,6 +62,9 @@ class DisplayImages:
     
     def create_storyboard(self):
         """Create the storyboard visualization"""
+        import tkinter as tk
+        from tkinter import ttk
+        
         # Story title
         ttk.Label(
             self.main_frame, 
@@ -55,17 +85,28 @@ class DisplayImages:
         notebook.add(characters_tab, text="Characters")
         notebook.add(settings_tab, text="Settings")
         
-        # Fill story tab
+        # Fill story tab, which is shown first
         self.create_story_tab(story_tab)
         
-        # Fill characters tab
-        self.create_characters_tab(characters_tab)
+        # Fill the characters and settings tabs the first time they are selected
+        pending_tabs = {
+            str(characters_tab): (self.create_characters_tab, characters_tab),
+            str(settings_tab): (self.create_settings_tab, settings_tab)
+        }
+        
+        def fill_selected_tab(event):
+            pending = pending_tabs.pop(notebook.select(), None)
+            if pending is not None:
+                create_tab, tab = pending
+                create_tab(tab)
         
-        # Fill settings tab
-        self.create_settings_tab(settings_tab)
+        notebook.bind("<<NotebookTabChanged>>", fill_selected_tab)
     
     def create_story_tab(self, parent):
         """Create the story visualization tab"""
+        import tkinter as tk
+        from tkinter import ttk, scrolledtext
+        
         # Theme description
         desc_frame = ttk.Frame(parent)
         desc_frame.pack(fill=tk.X, pady=(0, 20))
@@ -76,11 +117,13 @@ class DisplayImages:
             style="Subhead.TLabel"
         ).pack(anchor=tk.W)
         
-        ttk.Label(
-            desc_frame, 
-            text=self.story_data['theme']['description'],
-            wraplength=800
-        ).pack(anchor=tk.W, padx=10)
+        # Wrapped once up front, so the label doesn't re-break lines on every resize; each
+        # line is wrapped on its own so the description keeps its paragraph breaks
+        description = "\n".join(
+            textwrap.fill(line, width=_DESCRIPTION_WIDTH)
+            for line in self.story_data['theme']['description'].splitlines()
+        )
+        ttk.Label(desc_frame, text=description).pack(anchor=tk.W, padx=10)
         
         # Story text with scrollbars
         story_frame = ttk.LabelFrame(parent, text="Story")
@@ -94,11 +137,14 @@ class DisplayImages:
             pady=10
         )
         story_text.pack(fill=tk.BOTH, expand=True)
-        story_text.insert(tk.END, self.story_data['story_text'])
-        story_text.config(state=tk.DISABLED)  # Read-only
+        story_text.config(state=tk.DISABLED)  # Read-only from the start
+        _chunked_insert(story_text, self.story_data['story_text'])
     
     def create_characters_tab(self, parent):
         """Create the characters visualization tab"""
+        import tkinter as tk
+        from tkinter import ttk
+        
         characters = self.story_data['characters']
         
         # Create a canvas with scrollbar for many characters
@@ -131,47 +177,58 @@ class DisplayImages:
         # Update scroll region when content size changes
         content_frame.update_idletasks()
         canvas.config(scrollregion=canvas.bbox("all"))
+        content_frame.bind(
+            "<Configure>",
+            lambda event: canvas.config(scrollregion=canvas.bbox("all"))
+        )
     
     def create_character_box(self, parent, character):
         """Create a visual box for a character"""
-        # Role
-        ttk.Label(
-            parent, 
-            text=f"Role: {character['role']}",
-            font=("Georgia", 12, "bold")
-        ).pack(anchor=tk.W, padx=10, pady=(5, 0))
-        
-        # Portrait "frame"
-        portrait_frame = ttk.Frame(parent, borderwidth=2, relief="solid")
-        portrait_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        # Add character details in a grid
-        grid_frame = ttk.Frame(portrait_frame)
-        grid_frame.pack(padx=10, pady=10, fill=tk.X)
-        
-        # Row 1: Gender
-        ttk.Label(grid_frame, text="Gender:", width=10).grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Label(grid_frame, text=character['gender']).grid(row=0, column=1, sticky=tk.W, pady=2)
+        import tkinter as tk
         
-        # Row 2: Virtue
-        ttk.Label(grid_frame, text="Virtue:", width=10).grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Label(grid_frame, text=character['virtue']).grid(row=1, column=1, sticky=tk.W, pady=2)
-        
-        # Row 3: Flaw
-        ttk.Label(grid_frame, text="Flaw:", width=10).grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Label(grid_frame, text=character['flaw']).grid(row=2, column=1, sticky=tk.W, pady=2)
-        
-        # Row 4: Goal
-        ttk.Label(grid_frame, text="Goal:", width=10).grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Label(grid_frame, text=character['goal']).grid(row=3, column=1, sticky=tk.W, pady=2)
-        
-        # Row 5: Backstory
-        ttk.Label(grid_frame, text="Backstory:", width=10).grid(row=4, column=0, sticky=tk.NW, pady=2)
-        backstory_label = ttk.Label(grid_frame, text=character['backstory'], wraplength=500)
-        backstory_label.grid(row=4, column=1, sticky=tk.W, pady=2)
+        # Role and details as styled runs in one Text widget, instead of a
+        # grid of labels per character
+        details = tk.Text(
+            parent,
+            height=6,  # One line per detail until fitted to the wrapped text
+            wrap=tk.WORD,
+            font=("Georgia", 11),
+            borderwidth=2,
+            relief="solid",
+            padx=10,
+            pady=10
+        )
+        details.tag_configure('role', font=("Georgia", 12, "bold"), spacing3=8)
+        details.tag_configure('label', font=("Georgia", 11, "bold"))
+        
+        details.insert(tk.END, f"Role: {character['role']}\n", 'role')
+        for label, key in (
+            ("Gender", 'gender'),
+            ("Virtue", 'virtue'),
+            ("Flaw", 'flaw'),
+            ("Goal", 'goal'),
+            ("Backstory", 'backstory')
+        ):
+            details.insert(tk.END, f"{label}: ", 'label', f"{character[key]}\n")
+        details.delete("end-2c")  # Trailing newline
+        
+        details.config(state=tk.DISABLED)  # Read-only
+        details.pack(fill=tk.X, padx=10, pady=10)
+        
+        # Sized to the wrapped content rather than a fixed height, so a long backstory
+        # isn't clipped; refitted whenever a width change rewraps it
+        def fit_to_content(event=None):
+            lines = details.count("1.0", "end", "displaylines")
+            if lines and lines[0] != int(details.cget("height")):
+                details.config(height=lines[0])
+        
+        details.bind("<Configure>", fit_to_content)
     
     def create_settings_tab(self, parent):
         """Create the settings visualization tab"""
+        import tkinter as tk
+        from tkinter import ttk
+        
         settings = self.story_data['settings']
         
         # Create a frame for settings
@@ -268,6 +325,8 @@ class DisplayImages:
     
     def export_as_html(self):
         """Export story as HTML"""
+        from tkinter import messagebox
+        
         messagebox.showinfo(
             "Export Information", 
             "HTML export feature will be implemented in a future version."
@@ -275,6 +334,8 @@ class DisplayImages:
     
     def export_as_pdf(self):
         """Export story as PDF"""
+        from tkinter import messagebox
+        
         messagebox.showinfo(
             "Export Information", 
             "PDF export feature will be implemented in a future version."
@@ -283,14 +344,17 @@ class DisplayImages:
 
 def load_story_data():
     """Load story data from the JSON file"""
+    from utils import load_json
+    
     temp_file = os.path.join('temp', 'storyboard_data.json')
     
     if not os.path.exists(temp_file):
         return None
     
     try:
-        with open(temp_file, 'r') as f:
-            return json.load(f)
+        # Parse straight from bytes, skipping a decode through a text wrapper
+        with open(temp_file, 'rb') as f:
+            return load_json(f.read())
     except Exception as e:
         print(f"Error loading story data: {e}")
         return None
@@ -306,6 +370,7 @@ def main():
         return
     
     # Create the main window
+    import tkinter as tk
     root = tk.Tk()
     app = DisplayImages(root, story_data)
     
@@ -3,56 +3,257 @@ Enhanced Jane Austen Storytelling Experience
 A command-line interactive storytelling system with voice capabilities and audio features.
 """
 
+import atexit
 import os
+import queue
 import random
 import json
+import shutil
+import sys
+import tempfile
+import threading
 import time
-from gtts import gTTS
-import speech_recognition as sr
-import pygame
 from story_templates import get_story_templates, get_story_themes
 from character_generator import CharacterGenerator
-from audio_manager import AudioManager
-from utils import clear_screen, print_with_typing_effect, get_user_input
+from utils import (
+    clear_screen, print_with_typing_effect, get_user_input, split_sentences, dump_story_json,
+    open_atomic, print_menu
+)
+
+# gTTS and speech_recognition are imported only when narration or voice input is chosen, so a
+# session that declines both never loads them. pygame (through AudioManager) is imported on the
+# first sound; run_story_generator plays one at startup, so only callers that just generate or
+# save stories skip it.
+
+# Vosk recognizes speech locally when it and a model are installed; otherwise Google's service is used
+try:
+    from vosk import Model, KaldiRecognizer, SetLogLevel
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+VOSK_MODEL_PATH = os.environ.get('VOSK_MODEL_PATH', 'vosk-model-small-en-us-0.15')
+_VOSK_SAMPLE_RATE = 16000
+
+# Settings drawn from when generate_story is called without any
+_DEFAULT_LOCATIONS = (
+    'Netherfield Park', 'Longbourn Estate', 'Pemberley', 
+    'Hartfield Estate', 'Kellynch Hall', 'Mansfield Park'
+)
+_DEFAULT_SEASONS = ('spring', 'summer', 'autumn', 'winter')
+
+# Used when the theme has no template of its own
+_DEFAULT_STORY_TEMPLATE = "{protagonist_name}, a {protagonist_social_class}, embarks on a journey of self-discovery."
+
+# Used when a theme's template asks for something format_info doesn't provide
+_SIMPLIFIED_STORY_TEMPLATE = (
+    "{protagonist_name}, a {protagonist_social_class} who is {protagonist_personality}, "
+    "finds adventure and romance in {location} during {season} in {time_period}."
+)
+
+# Theme-specific elaboration appended by expand_story, for the first key found in the theme name
+_THEME_ELABORATIONS = {
+    "Romantic Courtship": lambda settings, characters: (
+        f"\n\nThe social gatherings at {settings['location']} have become the talk of the county. "
+        f"As {characters[0]['name']} navigates the expectations of society, "
+        "the heart yearns for deeper connections beyond mere social standing."
+    ),
+    "Social Intrigue": lambda settings, characters: (
+        f"\n\nBehind the elegant façades of {settings['location']}, whispers and secrets "
+        f"circulate like the evening breeze. {characters[0]['name']} must discern "
+        "truth from falsehood as alliances form and dissolve with each passing day."
+    ),
+    "Marriage Prospects": lambda settings, characters: (
+        f"\n\nThe question of matrimony weighs heavily on {characters[0]['name']}'s mind. "
+        "A good match could secure comfort and status, but at what cost to personal happiness? "
+        "The season's balls and gatherings become a chessboard of strategic introductions."
+    ),
+    "Inheritance": lambda settings, characters: (
+        f"\n\nThe letter that arrived at {settings['location']} has changed everything. "
+        f"Now {characters[0]['name']} must reconsider every relationship and opportunity "
+        "in the light of this newfound circumstance."
+    ),
+}
+
+# Saved HTML stories are written as this header, the story text, then the footer
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Jane Austen Inspired Story</title>
+    <style>
+        body { font-family: 'Baskerville', 'Garamond', serif; margin: 40px; line-height: 1.6; }
+        .story-container { max-width: 800px; margin: 0 auto; }
+        h1 { color: #5B3758; text-align: center; }
+        .story { white-space: pre-line; }
+        .footer { margin-top: 40px; text-align: center; font-style: italic; }
+    </style>
+</head>
+<body>
+    <div class="story-container">
+        <h1>A Tale in the Style of Jane Austen</h1>
+        <div class="story">"""
+
+_HTML_FOOTER = """</div>
+        <div class="footer">Generated on {date}</div>
+    </div>
+</body>
+</html>
+"""
+
+# Mixer output format; the rate matches the 44.1kHz placeholder tones built by AudioManager
+_MIXER_FREQUENCY = 44100
+_MIXER_BUFFER = 4096
+
+# Sound effects played during run_story_generator, generated together when audio starts
+_SOUND_EFFECTS = ('welcome', 'selection', 'character', 'writing', 'save', 'goodbye')
+
+# The gTTS class, once _load_gtts has imported it
+_gTTS = None
+
+def _load_gtts():
+    """Import gTTS on first use"""
+    global _gTTS
+    if _gTTS is None:
+        from gtts import gTTS
+        _gTTS = gTTS
+    return _gTTS
+
+def _save_speech(text, filename):
+    """Synthesize text with gTTS and save it as an MP3"""
+    _load_gtts()(text=text, lang='en', slow=False).save(filename)
+
+# Pause between paragraphs when showing the story, in seconds
+_PARAGRAPH_PAUSE = 0.1
+
+def _print_paragraphs(text, pause=_PARAGRAPH_PAUSE):
+    """Print text a paragraph at a time with a short pause between, rather than typing each character"""
+    paragraphs = text.split("\n\n")
+    for i, paragraph in enumerate(paragraphs):
+        sys.stdout.write(paragraph + ("\n\n" if i < len(paragraphs) - 1 else "\n"))
+        sys.stdout.flush()
+        time.sleep(pause)
+
+def _iter_queue(items):
+    """Yield queue items until the None sentinel"""
+    while (item := items.get()) is not None:
+        yield item
 
 class JaneAustenStoryGenerator:
     def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-
         self.char_generator = CharacterGenerator()
-        self.audio_manager = AudioManager()
+        # Created, along with pygame and its mixer, the first time a sound is needed
+        self._audio_manager = None
         
         self.story_themes = get_story_themes()
         self.story_templates = get_story_templates()
+        
+        # Private RNG for default settings, independent of the shared module-level one
+        self._rng = random.Random()
 
         self.voice_recognition_enabled = False
-        self.recognizer = sr.Recognizer()
+        self.recognizer = None
+        # Input function handed to get_user_input: get_voice_input once voice works, else None for the keyboard
+        self._voice_fn = None
+        self.vosk_model = None
+        self._microphone = None
+        
+        # Stop signal for the current streamed narration; each narration gets a fresh one
+        self._narration_stop = threading.Event()
+
+    @property
+    def audio_manager(self):
+        """The AudioManager, starting pygame and its mixer on first use"""
+        if self._audio_manager is None:
+            import pygame
+            from audio_manager import AudioManager
+            
+            # A larger mixer buffer means fewer audio callbacks and no underruns during narration;
+            # pre_init must come before pygame.init(), which initializes the mixer too
+            pygame.mixer.pre_init(frequency=_MIXER_FREQUENCY, size=-16, channels=2, buffer=_MIXER_BUFFER)
+            pygame.init()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self._audio_manager = AudioManager()
+            self._audio_manager.preload(_SOUND_EFFECTS)
+        return self._audio_manager
 
     def initialize_voice_recognition(self):
         """Try to initialize speech recognition"""
         try:
-            with sr.Microphone() as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            import speech_recognition as sr
+        except ImportError as e:
+            print(f"Could not initialize voice recognition: {e}")
+            return
+        
+        try:
+            if self.recognizer is None:
+                self.recognizer = sr.Recognizer()
+            # The microphone stream is opened once and kept open for every later prompt
+            if self._microphone is None:
+                microphone = sr.Microphone()
+                microphone.__enter__()
+                self._microphone = microphone
+                atexit.register(self._close_microphone)
+            self.recognizer.adjust_for_ambient_noise(self._microphone, duration=1)
             self.voice_recognition_enabled = True
+            self._voice_fn = self.get_voice_input
             print("Voice recognition successfully initialized.")
+            self._load_vosk_model()
         except (sr.RequestError, sr.UnknownValueError, OSError) as e:
             print(f"Could not initialize voice recognition: {e}")
             self.voice_recognition_enabled = False
+            self._voice_fn = None
+            self._close_microphone()
+
+    def _close_microphone(self):
+        """Close the persistent microphone stream, if one is open"""
+        if self._microphone is not None:
+            self._microphone.__exit__(None, None, None)
+            self._microphone = None
+
+    def _load_vosk_model(self):
+        """Load the local Vosk model once, if Vosk and the model are installed"""
+        if not VOSK_AVAILABLE or self.vosk_model is not None:
+            return
+        if not os.path.isdir(VOSK_MODEL_PATH):
+            print(f"Vosk model not found at {VOSK_MODEL_PATH}; using online recognition.")
+            return
+        SetLogLevel(-1)
+        try:
+            self.vosk_model = Model(VOSK_MODEL_PATH)
+        except Exception as e:
+            # Vosk raises a plain Exception for a model it can't load
+            print(f"Could not load Vosk model: {e}; using online recognition.")
+            return
+        print("Using offline speech recognition.")
+
+    def _recognize(self, audio):
+        """Transcribe captured audio, locally with Vosk when its model is loaded"""
+        if self.vosk_model is None:
+            return self.recognizer.recognize_google(audio)
+        
+        recognizer = KaldiRecognizer(self.vosk_model, _VOSK_SAMPLE_RATE)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=_VOSK_SAMPLE_RATE, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get("text", "")
+        if not text:
+            import speech_recognition as sr
+            raise sr.UnknownValueError()
+        return text
 
     def get_voice_input(self, prompt):
         """Get input from voice if available, otherwise use keyboard"""
         if not self.voice_recognition_enabled:
             return input(prompt)
         
+        import speech_recognition as sr  # Already loaded by initialize_voice_recognition
+        
         print(prompt)
         try:
-            with sr.Microphone() as source:
-                print("Listening...")
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
-                
+            print("Listening...")
+            audio = self.recognizer.listen(self._microphone, timeout=5, phrase_time_limit=10)
+            
             print("Processing...")
-            text = self.recognizer.recognize_google(audio)
+            text = self._recognize(audio)
             print(f"You said: {text}")
             return text
         except sr.WaitTimeoutError:
@@ -65,26 +266,26 @@ class JaneAustenStoryGenerator:
             print("Speech recognition service unavailable. Using text input instead.")
             return input(prompt)
 
+    def _prompt_all_names(self, num_characters):
+        """Ask once for any custom character names, returning one name or None per character"""
+        answer = get_user_input(
+            f"Name any of the {num_characters} characters, separated by commas, or say none: ",
+            self._voice_fn
+        ).strip()
+        
+        names = [] if answer.lower() in ("", "none", "no") else [name.strip() for name in answer.split(",")]
+        names = names[:num_characters]
+        return [name or None for name in names] + [None] * (num_characters - len(names))
+
     def create_characters(self, num_characters):
         """Create multiple characters"""
+        # One prompt covers every character's name, so voice input needs a single round trip
+        names = self._prompt_all_names(num_characters)
+        
         characters = []
-        for i in range(num_characters):
+        for i, name in enumerate(names):
             print(f"\nCreating Character {i+1}:")
-            
-            # Get name input
-            custom_name = get_user_input(
-                "Would you like to name this character? (yes/no): ", 
-                self.get_voice_input if self.voice_recognition_enabled else None
-            )
-            
-            if custom_name.lower().startswith('y'):
-                name = get_user_input(
-                    "Enter character name: ", 
-                    self.get_voice_input if self.voice_recognition_enabled else None
-                )
-                character = self.char_generator.create_character(custom_name=name)
-            else:
-                character = self.char_generator.create_character()
+            character = self.char_generator.create_character(custom_name=name)
             
             characters.append(character)
             print(f"\nCharacter {i+1}: {character['name']}")
@@ -98,21 +299,11 @@ class JaneAustenStoryGenerator:
 
     def generate_story(self, theme, characters, settings=None):
         """Generate a narrative based on selected theme and characters"""
-        # Get the appropriate template
-        if theme in self.story_templates:
-            template = self.story_templates[theme]
-        else:
-            # Fallback to a simple template if theme not found
-            template = "{protagonist_name}, a {protagonist_social_class}, embarks on a journey of self-discovery."
-        
         # Default settings if none provided
         if not settings:
             settings = {
-                'location': random.choice([
-                    'Netherfield Park', 'Longbourn Estate', 'Pemberley', 
-                    'Hartfield Estate', 'Kellynch Hall', 'Mansfield Park'
-                ]),
-                'season': random.choice(['spring', 'summer', 'autumn', 'winter']),
+                'location': self._rng.choice(_DEFAULT_LOCATIONS),
+                'season': self._rng.choice(_DEFAULT_SEASONS),
                 'time_period': 'the Regency era'
             }
         
@@ -125,36 +316,33 @@ class JaneAustenStoryGenerator:
             'protagonist_occupation': protagonist['occupation']
         }
         
-        # Format information about supporting characters
-        supporting_chars = []
-        for i, char in enumerate(characters[1:], 1):
-            char_info = {
-                f'character{i}_name': char['name'],
-                f'character{i}_social_class': char['social_class'],
-                f'character{i}_personality': char['personality'],
-                f'character{i}_occupation': char['occupation']
-            }
-            supporting_chars.append(char_info)
-        
-        # Combine all formatting information
+        # Combine all formatting information, adding supporting characters directly
         format_info = {**protagonist_info, **settings}
-        for char_info in supporting_chars:
-            format_info.update(char_info)
+        for i, char in enumerate(characters[1:], 1):
+            format_info[f'character{i}_name'] = char['name']
+            format_info[f'character{i}_social_class'] = char['social_class']
+            format_info[f'character{i}_personality'] = char['personality']
+            format_info[f'character{i}_occupation'] = char['occupation']
         
         # Format the template
-        try:
-            story = template.format(**format_info)
-        except KeyError as e:
-            # Fallback in case template has placeholders we didn't provide
-            print(f"Warning: Template formatting error {e}. Using simplified template.")
-            story = f"{protagonist['name']}, a {protagonist['social_class']} who is {protagonist['personality']}, "
-            story += f"finds adventure and romance in {settings['location']} during {settings['season']} in {settings['time_period']}."
+        story = self._format_template(theme, format_info)
         
         # Generate a more elaborate story by adding context
         expanded_story = self.expand_story(story, characters, settings, theme)
         
         return expanded_story
 
+    def _format_template(self, theme, format_info):
+        """Fill in the theme's template, falling back to a simple story if it can't be formatted"""
+        # Fallback to a simple template if theme not found
+        template = self.story_templates.get(theme, _DEFAULT_STORY_TEMPLATE)
+        try:
+            return template.format_map(format_info)
+        except KeyError as e:
+            # Fallback in case template has placeholders we didn't provide
+            print(f"Warning: Template formatting error {e}. Using simplified template.")
+            return _SIMPLIFIED_STORY_TEMPLATE.format_map(format_info)
+
     def expand_story(self, base_story, characters, settings, theme):
         """Expand the base story with more narrative details"""
         # Create an introduction
@@ -172,25 +360,10 @@ class JaneAustenStoryGenerator:
         narrative = base_story
         
         # Add some theme-specific elaboration
-        if "Romantic Courtship" in theme:
-            narrative += f"\n\nThe social gatherings at {settings['location']} have become the talk of the county. "
-            narrative += f"As {characters[0]['name']} navigates the expectations of society, "
-            narrative += f"the heart yearns for deeper connections beyond mere social standing."
-        
-        elif "Social Intrigue" in theme:
-            narrative += f"\n\nBehind the elegant façades of {settings['location']}, whispers and secrets "
-            narrative += f"circulate like the evening breeze. {characters[0]['name']} must discern "
-            narrative += f"truth from falsehood as alliances form and dissolve with each passing day."
-        
-        elif "Marriage Prospects" in theme:
-            narrative += f"\n\nThe question of matrimony weighs heavily on {characters[0]['name']}'s mind. "
-            narrative += f"A good match could secure comfort and status, but at what cost to personal happiness? "
-            narrative += f"The season's balls and gatherings become a chessboard of strategic introductions."
-            
-        elif "Inheritance" in theme:
-            narrative += f"\n\nThe letter that arrived at {settings['location']} has changed everything. "
-            narrative += f"Now {characters[0]['name']} must reconsider every relationship and opportunity "
-            narrative += f"in the light of this newfound circumstance."
+        for theme_key, elaborate in _THEME_ELABORATIONS.items():
+            if theme_key in theme:
+                narrative += elaborate(settings, characters)
+                break
         
         # Add a conclusion
         conclusion = f"\n\nAs the {settings['season']} days pass at {settings['location']}, "
@@ -203,44 +376,6 @@ class JaneAustenStoryGenerator:
         
         return full_story
 
-    def text_to_speech(self, text, filename='story_narration.mp3'):
-        """Convert text to speech with improved settings"""
-        print("Generating narration audio...")
-        
-        try:
-            # Create chunks of text to prevent gTTS limitations
-            max_chars = 5000  # gTTS has limitations on text length
-            chunks = [text[i:i+max_chars] for i in range(0, len(text), max_chars)]
-            
-            temp_files = []
-            for i, chunk in enumerate(chunks):
-                temp_filename = f"temp_chunk_{i}.mp3"
-                tts = gTTS(text=chunk, lang='en', slow=False)
-                tts.save(temp_filename)
-                temp_files.append(temp_filename)
-            
-            # If there's only one chunk, just rename it
-            if len(temp_files) == 1:
-                os.rename(temp_files[0], filename)
-            else:
-                # Initialize pygame mixer to combine audio files
-                pygame.mixer.init()
-                
-                # Load and play combined audio (this is simplified, actually merging MP3s properly
-                # would require more complex audio processing)
-                self.audio_manager.combine_audio_files(temp_files, filename)
-                
-                # Clean up temp files
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-            
-            print(f"Narration saved as {filename}")
-            return True
-        except Exception as e:
-            print(f"Error generating speech: {e}")
-            return False
-
     def save_story(self, story, format_type='txt', filename=None):
         """Save generated story in various formats"""
         if filename is None:
@@ -253,7 +388,7 @@ class JaneAustenStoryGenerator:
             filename = filename.split('.')[0]
             
         if format_type == 'txt':
-            with open(f"{filename}.txt", 'w') as file:
+            with open_atomic(f"{filename}.txt") as file:
                 file.write(story)
             print(f"Story saved as {filename}.txt")
             return f"{filename}.txt"
@@ -267,36 +402,17 @@ class JaneAustenStoryGenerator:
                 "word_count": len(story.split())
             }
             
-            with open(f"{filename}.json", 'w') as file:
-                json.dump(story_data, file, indent=2)
+            with open_atomic(f"{filename}.json", 'wb') as file:
+                file.write(dump_story_json(story_data))
             print(f"Story saved as {filename}.json")
             return f"{filename}.json"
             
         elif format_type == 'html':
-            # Create a simple HTML document with the story
-            html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Jane Austen Inspired Story</title>
-    <style>
-        body {{ font-family: 'Baskerville', 'Garamond', serif; margin: 40px; line-height: 1.6; }}
-        .story-container {{ max-width: 800px; margin: 0 auto; }}
-        h1 {{ color: #5B3758; text-align: center; }}
-        .story {{ white-space: pre-line; }}
-        .footer {{ margin-top: 40px; text-align: center; font-style: italic; }}
-    </style>
-</head>
-<body>
-    <div class="story-container">
-        <h1>A Tale in the Style of Jane Austen</h1>
-        <div class="story">{story}</div>
-        <div class="footer">Generated on {time.strftime("%B %d, %Y")}</div>
-    </div>
-</body>
-</html>
-"""
-            with open(f"{filename}.html", 'w') as file:
-                file.write(html_content)
+            # Write the fixed page around the story, rather than building the whole document in memory
+            with open_atomic(f"{filename}.html") as file:
+                file.write(_HTML_HEADER)
+                file.write(story)
+                file.write(_HTML_FOOTER.format(date=time.strftime("%B %d, %Y")))
             print(f"Story saved as {filename}.html")
             return f"{filename}.html"
         
@@ -304,12 +420,62 @@ class JaneAustenStoryGenerator:
             print(f"Unsupported format: {format_type}")
             return None
 
-    def play_story_narration(self, audio_file, background_music=None):
-        """Play the narration with optional background music"""
-        self.audio_manager.play_narration_with_background(audio_file, background_music)
+    def stream_narration(self, text, background_music=None):
+        """Narrate text sentence by sentence, starting playback as soon as the first sentence is synthesized
+
+        Returns whether narration started.
+        """
+        self.stop_narration()
+        try:
+            _load_gtts()  # Import once here, not inside the synthesis thread
+            # A synthesis thread from an earlier narration may still be finishing a sentence,
+            # so this one writes into its own temporary directory
+            narration_dir = tempfile.mkdtemp(prefix="austen_narration_")
+        except (ImportError, OSError) as e:
+            print(f"Error generating speech: {e}")
+            return False
+        
+        # It also gets its own stop signal, so stopping it never stops a later narration
+        stop = self._narration_stop = threading.Event()
+        ready_files = queue.Queue()
+        
+        def synthesize():
+            try:
+                for i, sentence in enumerate(split_sentences(text)):
+                    if stop.is_set():
+                        break
+                    sentence_file = os.path.join(narration_dir, f"sentence_{i}.mp3")
+                    _save_speech(sentence, sentence_file)
+                    if stop.is_set():
+                        break
+                    ready_files.put(sentence_file)
+            except Exception as e:
+                print(f"Error generating speech: {e}")
+            finally:
+                ready_files.put(None)
+                # The files are needed until playback is stopped; then this thread removes them all
+                stop.wait()
+                shutil.rmtree(narration_dir, ignore_errors=True)
+        
+        threading.Thread(target=synthesize, daemon=True).start()
+        self.audio_manager.play_narration_stream(_iter_queue(ready_files), background_music)
+        return True
+
+    def stop_narration(self):
+        """Stop streamed narration; its synthesis thread then removes the temporary audio files"""
+        # Playback stops first, so no file is being loaded when the files are removed
+        if self._audio_manager is not None:
+            self._audio_manager.stop_playback()
+        self._narration_stop.set()
 
     def run_story_generator(self):
         """Main story generation workflow"""
+        # Line editing and history for every input() prompt, where the platform has readline
+        try:
+            import readline  # noqa: F401  (importing it is enough)
+        except ImportError:
+            pass
+        
         clear_screen()
         self.audio_manager.play_sound_effect('welcome')
         
@@ -331,12 +497,11 @@ class JaneAustenStoryGenerator:
         
         # Theme Selection
         print("\nAvailable Story Themes:")
-        for i, theme in enumerate(self.story_themes, 1):
-            print(f"{i}. {theme}")
+        print_menu(self.story_themes)
 
         theme_choice = get_user_input(
             "\nSelect a theme number: ", 
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         try:
@@ -358,12 +523,11 @@ class JaneAustenStoryGenerator:
         seasons = ["spring", "summer", "autumn", "winter"]
         
         print("\nAvailable Locations:")
-        for i, location in enumerate(locations, 1):
-            print(f"{i}. {location}")
+        print_menu(locations)
             
         location_choice = get_user_input(
             "\nSelect a location number: ",
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         try:
@@ -374,12 +538,11 @@ class JaneAustenStoryGenerator:
             selected_location = locations[0]
             
         print("\nAvailable Seasons:")
-        for i, season in enumerate(seasons, 1):
-            print(f"{i}. {season}")
+        print_menu(seasons)
             
         season_choice = get_user_input(
             "\nSelect a season number: ",
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         try:
@@ -401,7 +564,7 @@ class JaneAustenStoryGenerator:
         # Character Creation
         num_characters_input = get_user_input(
             "\nHow many characters would you like in your story? (1-5): ",
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         try:
@@ -417,19 +580,18 @@ class JaneAustenStoryGenerator:
         # Story Generation
         print("\nGenerating your Jane Austen inspired story...")
         self.audio_manager.play_sound_effect('writing')
-        time.sleep(2)  # Create anticipation
         
         story = self.generate_story(selected_theme, characters, settings)
         
         clear_screen()
         print("\n" + "="*80)
-        print_with_typing_effect(story, delay=0.01)
+        _print_paragraphs(story)
         print("="*80 + "\n")
 
         # Audio Narration
         narration_choice = get_user_input(
             "Would you like to hear your story narrated? (yes/no): ",
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         if narration_choice.lower().startswith('y'):
@@ -441,32 +603,27 @@ class JaneAustenStoryGenerator:
             else:
                 bg_music = 'general'
                 
-            # Create the narration
-            narration_file = "current_narration.mp3"
-            if self.text_to_speech(story, narration_file):
-                print("\nPlaying narration with background music...\n")
-                self.play_story_narration(narration_file, bg_music)
-                
+            # Stream the narration, so playback starts once the first sentence is ready
+            print("\nPlaying narration with background music...\n")
+            if self.stream_narration(story, bg_music):
                 # Wait for audio to finish or user to skip
                 print("\nPress Enter to stop playback and continue...")
                 input()
-                self.audio_manager.stop_playback()
+                self.stop_narration()
 
         # Save Options
         save_choice = get_user_input(
             "\nWould you like to save this story? (yes/no): ",
-            self.get_voice_input if self.voice_recognition_enabled else None
+            self._voice_fn
         )
         
         if save_choice.lower().startswith('y'):
             print("\nAvailable formats:")
-            print("1. Text file (.txt)")
-            print("2. JSON file (.json)")
-            print("3. HTML document (.html)")
+            print_menu(("Text file (.txt)", "JSON file (.json)", "HTML document (.html)"))
             
             format_choice = get_user_input(
                 "Select a format number: ",
-                self.get_voice_input if self.voice_recognition_enabled else None
+                self._voice_fn
             )
             
             try:
@@ -486,7 +643,7 @@ class JaneAustenStoryGenerator:
             
             custom_filename = get_user_input(
                 "Enter a filename (without extension) or press Enter for default: ",
-                self.get_voice_input if self.voice_recognition_enabled else None
+                self._voice_fn
             )
             
             if custom_filename:
@@ -499,13 +656,6 @@ class JaneAustenStoryGenerator:
         print("\nThank you for using the Jane Austen Interactive Storytelling Experience!")
         print("May your days be filled with wit, romance, and social observation.")
         self.audio_manager.play_sound_effect('goodbye')
-        
-        # Clean up temporary audio files
-        if os.path.exists("current_narration.mp3"):
-            try:
-                os.remove("current_narration.mp3")
-            except:
-                pass
 
 def main():
     story_generator = JaneAustenStoryGenerator()
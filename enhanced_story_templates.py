@@ -4,31 +4,36 @@ These templates provide richer narratives with greater diversity, complexity,
 and authentic period details to create more engaging stories.
 """
 
-def get_enhanced_story_themes():
-    """Return the list of enhanced and more diverse story themes"""
-    return [
-        'Romantic Courtship in Bath',
-        'Social Intrigue in Country Estate',
-        'Marriage Prospects in Regency England',
-        'Inheritance and Social Mobility',
-        'Family Honor and Reputation',
-        'Provincial Life and London Society',
-        'Lost Love Rekindled',
-        'Secret Engagement Revealed',
-        'Literary Pursuits and Intellectual Society',
-        'Naval Heroes and Wartime Separations',
-        'Music and the Accomplished Woman',
-        'Regency Era Politics and Reform',
-        'Forbidden Friendship Across Class Lines',
-        'Gothic Mysteries at an Ancient Manor',
-        'Life in the Clergy and Rural Parish',
-        'Female Entrepreneurship and Independence'
-    ]
-
-def get_enhanced_story_templates():
-    """Return the dictionary of enhanced story templates for each theme"""
-    return {
-        'Romantic Courtship in Bath': """
+import keyword
+import string
+import sys
+from collections import ChainMap
+from collections.abc import Mapping
+
+# Enhanced themes and their templates, shared read-only by every caller
+_THEMES = (
+    'Romantic Courtship in Bath',
+    'Social Intrigue in Country Estate',
+    'Marriage Prospects in Regency England',
+    'Inheritance and Social Mobility',
+    'Family Honor and Reputation',
+    'Provincial Life and London Society',
+    'Lost Love Rekindled',
+    'Secret Engagement Revealed',
+    'Literary Pursuits and Intellectual Society',
+    'Naval Heroes and Wartime Separations',
+    'Music and the Accomplished Woman',
+    'Regency Era Politics and Reform',
+    'Forbidden Friendship Across Class Lines',
+    'Gothic Mysteries at an Ancient Manor',
+    'Life in the Clergy and Rural Parish',
+    'Female Entrepreneurship and Independence'
+)
+
+# The template prose stays in the source: unmarshalling it from the cached .pyc is faster
+# than reading and splitting a separate data file, and it keeps each theme beside its text
+_RAW_TEMPLATES = {
+    'Romantic Courtship in Bath': """
 In the elegant setting of Bath during a particularly lively {season} in {time_period}, {protagonist_name}, a {protagonist_personality} {protagonist_social_class} with a discerning eye for authentic character, arrives reluctantly at the insistence of family.
 
 The routine of taking the waters at the Pump Room and attending assemblies at the Upper Rooms initially seems tedious to {protagonist_name}, who prefers the intellectual stimulation of books to the performative nature of society. This changes dramatically after a chance encounter with {character1_name}, a {character1_personality} {character1_occupation} whose reputation has preceded them.
@@ -45,8 +50,8 @@ When a scandalous rumor threatens {character1_name}'s standing in society, {prot
 
 The pressure of societal expectations collides with the authentic connection they have formed, forcing both to evaluate what they truly value in life. Will the judgments of society prevail, or will they find the courage to pursue a relationship based on genuine understanding rather than convention?
 """,
-        
-        'Social Intrigue in Country Estate': """
+    
+    'Social Intrigue in Country Estate': """
 At {location} during a crisp {season} in {time_period}, {protagonist_name}, a {protagonist_personality} {protagonist_social_class} with uncommon powers of perception, finds themselves drawn into a web of intrigue during what was meant to be a restorative country visit.
 
 The carefully maintained social harmony of {location} is disrupted by the arrival of {character1_name}, whose substantial fortune from achievements in {character1_occupation} has earned them entry into circles previously closed to one of their background. Society watches with both fascination and suspicion as {character1_name} navigates this new terrain with a confidence that some find refreshing and others impertinent.
@@ -63,8 +68,8 @@ As the household fractures into factions, {protagonist_name} must determine whet
 
 When the truth finally emerges during a fateful dinner party, long-buried secrets rise to the surface, forcing everyone present to reconsider not only what they thought they knew about the newcomers, but about their own family histories as well.
 """,
-        
-        'Marriage Prospects in Regency England': """
+    
+    'Marriage Prospects in Regency England': """
 In the marriageable society of {time_period}, where economic considerations often outweigh personal inclination, {protagonist_name} approaches the social season with trepidation. Though possessed of a {protagonist_personality} nature and the accomplishments expected of a {protagonist_social_class}, {protagonist_name} harbors private doubts about the institution that society insists represents the pinnacle of feminine achievement.
 
 The family estate's entailment complications create urgency around securing an advantageous match, a pressure {protagonist_name} feels acutely each time their practical-minded mother calculates aloud the fortune of every eligible person in the vicinity. The responsibility of potentially securing the family's future weighs heavily, creating an inner conflict between duty and authentic desire.
@@ -81,8 +86,8 @@ When a family crisis suddenly removes the financial pressure for an advantageous
 
 As the season draws to a close, {protagonist_name} must navigate between prudence and authenticity, between others' expectations and personal truth, ultimately determining what kind of life—and what kind of partnership—will bring genuine fulfillment rather than merely the appearance of success.
 """,
-        
-        'Inheritance and Social Mobility': """
+    
+    'Inheritance and Social Mobility': """
 The quiet life of {protagonist_name}, a {protagonist_personality} {protagonist_social_class} who has adapted to limited prospects with dignity, transforms overnight with the arrival of a solicitor's letter. An eccentric great-uncle, long estranged from the family, has named {protagonist_name} sole heir to an unexpected fortune, with one significant condition attached.
 
 Before this twist of fate, {protagonist_name}'s existence as a {protagonist_occupation} during the economic uncertainties of {season} in {time_period} had become one of resigned acceptance. The inheritance brings not only financial security but also a whirlwind of attention from {character1_name}, whose previous interactions had been characterized by polite indifference tinged with condescension.
@@ -100,7 +105,7 @@ When {protagonist_name} learns that certain new acquaintances have wagered on ho
 As the six-month period nears its conclusion, {protagonist_name} must determine what constitutes true value: the acceptance of a society based on external markers of worth, or relationships founded on mutual respect regardless of circumstance. The inheritance offers freedom, but the way it is used will define the person {protagonist_name} chooses to become.
 """,
 
-        'Family Honor and Reputation': """
+    'Family Honor and Reputation': """
 In the interconnected society of {time_period}, where a family's good name represents its most valuable possession, {protagonist_name} maintains a careful vigilance over their family's standing. As the {protagonist_personality} eldest sibling of a {protagonist_social_class} family residing near {location}, {protagonist_name} carries the dual responsibility of setting an example while guiding younger siblings through the hazards of society.
 
 The responsibility has grown heavier since Father's illness has left him unable to fulfill his traditional role as head of household. Though Mother maintains appearances admirably, it is increasingly {protagonist_name} who manages family affairs while presenting a serene face to society.
@@ -117,8 +122,8 @@ This revelation forces {protagonist_name} to confront uncomfortable truths about
 
 As private family discussions grow heated and divisions emerge over how to proceed, {protagonist_name} must determine whether preserving reputation according to society's rigid standards justifies the sacrifice of genuine happiness. Is family honor best served by conforming to external expectations, or by standing firmly behind the well-considered choices of its members, even when those choices invite scrutiny?
 """,
-        
-        'Provincial Life and London Society': """
+    
+    'Provincial Life and London Society': """
 {protagonist_name} has built a life of quiet contentment as a {protagonist_social_class} in the gentle rhythms of provincial existence near {location}. With {protagonist_personality} sensibilities and modest fulfillment in duties as a {protagonist_occupation}, the predictable patterns of rural society have provided a comfortable framework for existence, if not excitement.
 
 A letter bearing a London address and the seal of {character1_name}, a glamorous distant cousin known mainly through family anecdotes, shatters this comfortable routine. The letter contains an unexpected invitation to spend the {season} in London under {character1_name}'s sponsorship, ostensibly to "broaden horizons" before it is "too late to acquire metropolitan polish."
@@ -137,8 +142,8 @@ This incident coincides with discovering {character1_name}'s subtle manipulation
 
 As the season progresses toward its culmination at a grand ball where important social announcements are traditionally made, {protagonist_name} faces a decision with lifelong implications: embrace the sophisticated but often superficial existence that London offers, with its broader horizons but shallower connections, or return to the limited but authentic world of provincial life, where one is valued for character rather than fashion.
 """,
-        
-        'Lost Love Rekindled': """
+    
+    'Lost Love Rekindled': """
 Eight years earlier, during a summer that now seems to belong to a different lifetime, {protagonist_name}, a young and {protagonist_personality} {protagonist_social_class}, yielded to family pressure and severed an engagement to the then-unestablished {character1_name}. The decision, made under the persuasive guidance of a respected mentor who cited prudence and practical concerns, has lingered as a private wound that time has scabbed over but never truly healed.
 
 In the intervening years, {protagonist_name} has constructed a life of quiet purpose as a {protagonist_occupation}, finding meaning in small duties and the esteem of a limited circle. Though opportunities for other attachments have presented themselves, none have kindled the same certainty that characterized that early, abandoned connection.
@@ -155,8 +160,8 @@ The revelation that {character1_name} carries a cherished keepsake from their sh
 
 As the remaining time at {location} dwindles, unspoken questions hang between them: Has too much time passed to rebuild what was broken? Can hearts once severed truly mend, or do the scars themselves become barriers to genuine reconnection? And perhaps most crucially, if given a second chance, would either have the courage to defy the caution that divided them before?
 """,
-        
-        'Secret Engagement Revealed': """
+    
+    'Secret Engagement Revealed': """
 In the closely-observed community surrounding {location}, {protagonist_name} has maintained a clandestine engagement to {character1_name} for nearly six months. The secrecy stems not from shame but practical necessity; as a {protagonist_personality} {protagonist_social_class} with responsibilities as a {protagonist_occupation}, {protagonist_name} must first secure certain financial arrangements before their engagement can withstand public scrutiny.
 
 The delicate balance of privacy becomes increasingly difficult to maintain during {season}, when the influx of visitors and the heightened social calendar multiply opportunities for discovery. Each glance exchanged across a crowded drawing room, each carefully timed "coincidental" meeting on morning walks, carries the thrill of shared secrets alongside the risk of exposure.
@@ -174,7 +179,7 @@ The secret engagement becomes public in the most mortifying manner: not as a joy
 As {protagonist_name} attempts to repair the damage on all fronts, deeper questions emerge about whether a relationship begun in secrecy has established a foundation strong enough to withstand public scrutiny. The choice becomes whether to end the engagement in the face of opposition and misunderstanding, or to stand firmly together, demonstrating that genuine commitment can weather even the harshest judgment of society.
 """,
 
-        'Literary Pursuits and Intellectual Society': """
+    'Literary Pursuits and Intellectual Society': """
 In a society that values a woman's accomplishments primarily as ornamental attractions for securing a husband, {protagonist_name}, a {protagonist_personality} {protagonist_social_class} with uncommon intellectual curiosity, maintains a private literary life that far exceeds the modest displays of accomplishment expected in drawing rooms. 
 
 Behind the acceptable facade of watercolors and pianoforte, {protagonist_name} secretly corresponds with respected literary figures, reviews new publications for an anonymous periodical, and has even published modest works of their own under a masculine pseudonym. This intellectual double life provides fulfillment while protecting {protagonist_name} from the social censure that would accompany openly claiming such pursuits.
@@ -192,7 +197,7 @@ A crisis point arrives when {protagonist_name} learns that {character1_name} has
 As {protagonist_name} weighs the security of conventional life against the fulfillment of intellectual recognition, the deeper question emerges: which requires more courage—pursuing one's talents against society's constraints, or conforming to expectations while maintaining a hidden authentic self? And is intellectual compatibility a sufficient foundation for life's most personal decisions, or merely one factor among many to consider?
 """,
 
-        'Naval Heroes and Wartime Separations': """
+    'Naval Heroes and Wartime Separations': """
 The seaside town of {location} in {time_period}, with its naval base and constant flow of officers, exists in the dual reality of wartime England. Behind the cheerful bustle of High Street shops and assembly room dances lies the persistent anxiety of separations, the uncertainty of safe returns, and the emotional toll of loving those who answer duty's call.
 
 {protagonist_name}, a {protagonist_personality} {protagonist_social_class} whose family has served the Crown for generations, understands these contradictions intimately. Having grown up in naval circles, {protagonist_name} has developed a pragmatic perspective on the perpetual cycle of departures and homecomings that shapes life in a military community during {season}.
@@ -210,7 +215,7 @@ The decision point arrives sooner than expected when {character1_name} receives
 As {protagonist_name} weighs the profound fulfillment found in true compatibility against the practical realities of a naval officer's spouse, the broader question emerges: what kind of courage matters more—the bravery to link one's fate to a person whose duty will repeatedly claim them, or the fortitude to prioritize stability and continuous connection in building a life?
 """,
 
-        'Music and the Accomplished Woman': """
+    'Music and the Accomplished Woman': """
 In the genteel society of {time_period}, musical proficiency ranks among the most valued feminine accomplishments—a social necessity displayed in drawing rooms to demonstrate refinement and attract suitable marriage prospects. For {protagonist_name}, however, music transcends mere accomplishment; it represents a profound personal passion and artistic expression restrained by society's narrow expectations of a {protagonist_personality} {protagonist_social_class}.
 
 Having studied privately with a retired concert musician hidden away in the countryside, {protagonist_name} possesses technical abilities and interpretive understanding far exceeding the decorative performances expected at social gatherings. This creates an ongoing tension between authentic artistic expression and the modest displays deemed appropriate for someone of {protagonist_name}'s position and gender.
@@ -228,7 +233,7 @@ The evening of the performance arrives, bringing a critical choice: play the exp
 As {protagonist_name} sits at the instrument before the assembled company, the deeper question emerges: what constitutes true fulfillment—the security of meeting society's expectations skillfully, or the uncertain path of embracing one's authentic gifts even when they challenge prevailing notions of propriety? And can genuine artistic expression coexist with the social role {protagonist_name} has been raised to fill?
 """,
 
-        'Regency Era Politics and Reform': """
+    'Regency Era Politics and Reform': """
 In the drawing rooms and assembly halls of {time_period} England, political discussions officially remain the province of gentlemen, conducted over port after ladies withdraw. Yet {protagonist_name}, a {protagonist_personality} {protagonist_social_class} with keen intellect and uncommon education, maintains a private interest in the reform movements and political turbulence reshaping the nation during this pivotal era.
 
 Though carefully maintaining the appearance of conventional political indifference expected of their gender and station, {protagonist_name} has developed informed opinions on Catholic emancipation, parliamentary reform, and the conditions of workers in industrializing regions. These perspectives have been shaped partly through correspondence with a politically active cousin in London, whose letters provide insights beyond the heavily censored newspaper accounts available in the provinces.
@@ -246,7 +251,7 @@ Tensions escalate when local textile workers organize a demonstration against de
 As {protagonist_name} navigates the aftermath of this unplanned public stance, the fundamental question emerges: does integrity require expressing one's true principles even when they challenge prevailing views, or is there wisdom in maintaining private convictions while outwardly conforming to social expectations? And what value does society's approval hold when it requires suppressing one's authentic understanding of justice?
 """,
 
-        'Forbidden Friendship Across Class Lines': """
+    'Forbidden Friendship Across Class Lines': """
 The social landscape of {time_period} England is defined by rigid hierarchies and clearly delineated boundaries between classes. For {protagonist_name}, a {protagonist_personality} {protagonist_social_class} raised in accordance with these divisions, the established order has always seemed both natural and inevitable—until an unexpected connection challenges these fundamental assumptions.
 
 While fulfilling charitable duties in the village near {location} during {season}, {protagonist_name} encounters {character1_name}, whose intelligence and dignity defy the limited expectations society holds for a {character1_occupation}. Their initial interaction—practical assistance following an accident on the village path—leads to conversation revealing shared interests in literature and natural philosophy that transcend their different circumstances.
@@ -264,7 +269,7 @@ Swift repercussions follow: {protagonist_name}'s family restricts movement and d
 As external pressures mount, {protagonist_name} confronts increasingly uncomfortable truths about the arbitrary nature of class distinctions and the moral cost of conformity. The essential question crystallizes: Does living with integrity require accepting societal boundaries as immutable facts of existence, or does it demand recognizing genuine human worth even when it appears in unexpected forms? And what obligations do we hold to a system that provides privilege to some at the expense of others' basic dignity?
 """,
 
-        'Gothic Mysteries at an Ancient Manor': """
+    'Gothic Mysteries at an Ancient Manor': """
 The imposing silhouette of {location}, with its medieval foundations and generations of architectural additions, presents a dignified if somewhat forbidding aspect to {protagonist_name} upon arrival for an extended stay during a particularly atmospheric {season} in {time_period}. As a {protagonist_personality} {protagonist_social_class} accepting a last-minute invitation to fill a vacancy in the house party, {protagonist_name} anticipates a conventional country gathering despite the dramatic setting.
 
 Initial impressions support this expectation: the assembled guests represent familiar social types, the planned entertainments follow established patterns, and the current owners have brightened many of the manor's public rooms despite its reputation for gloom. Yet subtle discordant notes gradually emerge—servants who fall silent when guests approach, restricted areas with vague explanations, and the unexplained absence of the elderly relation officially hosting the gathering.
@@ -282,7 +287,7 @@ As evidence mounts that the manor's history contains darker chapters than its cu
 The deeper mystery becomes discerning where rational caution ends and irrational fear begins—and whether some family secrets, once disturbed, unleash consequences that transcend logical explanation. As {protagonist_name} navigates between healthy skepticism and mounting evidence of wrongdoing, the fundamental question emerges: Does seeking truth justify violating private boundaries, and once discovered, what responsibility do we bear for long-buried injustices that have shaped the present?
 """,
 
-        'Life in the Clergy and Rural Parish': """
+    'Life in the Clergy and Rural Parish': """
 The small but respectable parsonage at {location} represents both sanctuary and challenge to {protagonist_name}, a {protagonist_personality} {protagonist_social_class} newly established in the role of spiritual and social intermediary within a rural parish during {time_period}. Though the position offers security and defined purpose, it also places {protagonist_name} at the intersection of competing duties: to ecclesiastical superiors, to the wealthy patron who controls the living, and to parishioners whose needs often extend beyond spiritual concerns.
 
 As {season} brings both natural beauty and heightened hardship to the countryside, {protagonist_name} navigates the delicate balance required of a clergyperson expected to uphold social hierarchies while demonstrating Christian charity. Each decision—how church funds should be allocated, which tenant farmers merit advocacy with the estate, how firmly to press for improvements to laborers' cottages—carries implications for {protagonist_name}'s relationships and effectiveness in the community.
@@ -300,7 +305,7 @@ As {protagonist_name} attempts to forge a middle path—seeking reform without c
 The central question emerges through these challenges: How does one honor spiritual ideals within social structures that often contradict them? Is more accomplished through careful navigation of existing systems or through principled challenges to their foundations? And when formal authority derives from institutions themselves in need of reform, where does true moral leadership properly reside?
 """,
 
-        'Female Entrepreneurship and Independence': """
+    'Female Entrepreneurship and Independence': """
 In a society structured around female dependence, {protagonist_name} has carved out an uncommon path as a {protagonist_personality} {protagonist_social_class} who has developed modest but real financial independence through entrepreneurial initiative. Operating a small specialty shop near {location}—officially managed by a male relative but in practice directed entirely by {protagonist_name}'s business acumen—provides both livelihood and purpose outside traditional domestic roles.
 
 This carefully constructed independence faces unexpected challenges during {season} of {time_period}, when economic pressures and changing trade conditions threaten the enterprise's viability. The business difficulties coincide with increasing social pressure from family concerned about {protagonist_name}'s unusual position—particularly as age begins to push the boundaries of what might still be considered a temporary deviation from the expected path of matrimony.
@@ -315,7 +320,83 @@ The decision point arrives with unexpected urgency when a competitor attempts to
 
 As {protagonist_name} navigates these intersecting challenges, the fundamental question takes shape: Which form of security carries greater value—the social protection and emotional companionship of conventional marriage, or the self-determination and personal agency afforded by economic independence, however precarious? And is compromise possible that honors both the legitimate human desire for connection and the equally valid need for individual autonomy?
 """
-    }
+}
+
+# Intern the theme names, which every storyteller uses as dict keys, so lookups with them
+# compare by identity
+_THEMES = tuple(sys.intern(theme) for theme in _THEMES)
+
+def _make_renderer(theme, template, fields):
+    """Compile a function that renders template from a context mapping with a single f-string
+
+    Each field is read from the context into a local of the same name, and the template
+    itself, whose {field} placeholders are already f-string syntax, becomes the f-string.
+    Returns None if a field isn't a plain identifier.
+    """
+    names = tuple(dict.fromkeys(fields))
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name in names):
+        return None
+    
+    lines = ["def render(context):"]
+    lines.extend(f"    {name} = context[{name!r}]" for name in names)
+    lines.append(f"    return f{template!r}")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<enhanced template: {theme}>", "exec"), namespace)
+    return namespace["render"]
+
+# Per-template data as parallel sequences indexed by theme id. A template's body is filled
+# in by _LazyTemplates the first time it is read, and its renderer by _prepare the first
+# time it is rendered, so a run that uses one theme never prepares the other fifteen.
+_THEME_NAMES = _THEMES
+_TEMPLATE_BODIES = [None] * len(_THEME_NAMES)
+_TEMPLATE_RENDERERS = [None] * len(_THEME_NAMES)
+
+# Index of each theme into the per-template sequences
+_NAME_TO_ID = {theme: tid for tid, theme in enumerate(_THEME_NAMES)}
+
+class _LazyTemplates(Mapping):
+    """Read-only mapping of enhanced theme to template, preparing each template when first read"""
+    def __getitem__(self, theme):
+        tid = _NAME_TO_ID[theme]
+        body = _TEMPLATE_BODIES[tid]
+        if body is None:
+            # Trim the newlines the triple-quoted literal begins and ends with, once
+            body = _TEMPLATE_BODIES[tid] = _RAW_TEMPLATES[theme].strip('\n')
+        return body
+
+    def __iter__(self):
+        return iter(_THEME_NAMES)
+
+    def __len__(self):
+        return len(_THEME_NAMES)
+
+_TEMPLATES = _LazyTemplates()
+
+def _prepare(tid):
+    """Parse and compile the template with id tid, returning its renderer"""
+    theme = _THEME_NAMES[tid]
+    body = _TEMPLATES[theme]
+    fields = [field for _, field, _, _ in string.Formatter().parse(body) if field is not None]
+    # A field that can't be an f-string local is left to format_map
+    renderer = _make_renderer(theme, body, fields) or body.format_map
+    _TEMPLATE_RENDERERS[tid] = renderer
+    return renderer
+
+def get_enhanced_story_themes() -> tuple[str, ...]:
+    """Return the tuple of enhanced and more diverse story themes; use list() on it for a copy to change"""
+    return _THEMES
+
+def get_enhanced_story_templates():
+    """Return the read-only mapping of enhanced story templates for each theme, filled in as themes are read"""
+    return _TEMPLATES
+
+def render_enhanced_template(theme, context):
+    """Fill in an enhanced theme's template from context, as template.format_map(context) would"""
+    tid = _NAME_TO_ID[theme]
+    renderer = _TEMPLATE_RENDERERS[tid]
+    if renderer is None:
+        renderer = _prepare(tid)
+    return renderer(context)
 
 def add_enhanced_templates_to_classic(original_templates, enhanced_templates):
     """
@@ -326,10 +407,8 @@ def add_enhanced_templates_to_classic(original_templates, enhanced_templates):
         enhanced_templates: The dictionary of enhanced story templates
         
     Returns:
-        Combined templates dictionary with all themes
+        Combined templates mapping with all themes; enhanced templates take precedence,
+        and anything stored into it goes to its own dictionary, leaving both inputs unchanged
     """
-    combined = original_templates.copy()
-    # Add or update with enhanced templates
-    for theme, template in enhanced_templates.items():
-        combined[theme] = template
-    return combined
\ No newline at end of file
+    # Layer the inputs rather than copying them, so enhanced templates are only read when looked up
+    return ChainMap({}, enhanced_templates, original_templates)
\ No newline at end of file
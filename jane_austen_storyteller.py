@@ -5,14 +5,35 @@ A Python script for generating narratives in the style of Jane Austen.
 
 import os
 import random
-import json
 import time
 import re
+import sys
 from timeline_generator import TimelineGenerator
 from story_templates import get_story_themes, get_story_templates
-from enhanced_story_templates import get_enhanced_story_themes, get_enhanced_story_templates, add_enhanced_templates_to_classic
+from enhanced_story_templates import (
+    get_enhanced_story_themes, get_enhanced_story_templates, add_enhanced_templates_to_classic,
+    render_enhanced_template
+)
 from austen_quotes import AustenQuoteGenerator
 from visual_imagery import VisualImageryGenerator
+from utils import dump_story_json, open_atomic
+
+# Custom theme templates are stored under this prefix, so they never replace a built-in theme
+CUSTOM_TEMPLATE_PREFIX = "_custom::"
+
+# Interned template keys for each supporting character, by position; the enhanced
+# template field names are interned too, so rendering matches them by identity
+_CHARACTER_KEYS = {}
+
+def _character_keys(i):
+    """Return the name, social class, personality and occupation keys for supporting character i"""
+    keys = _CHARACTER_KEYS.get(i)
+    if keys is None:
+        keys = _CHARACTER_KEYS[i] = tuple(
+            sys.intern(f'character{i}_{field}')
+            for field in ('name', 'social_class', 'personality', 'occupation')
+        )
+    return keys
 
 # Try to import the display_images module if available
 try:
@@ -269,10 +290,11 @@ class JaneAustenStoryGenerator:
                 2 = Moderate complexity with some literary embellishments
                 3 = Complex narrative with rich details and Austen-like prose
         """
-        # Get the appropriate template
-        if theme in self.story_templates:
-            template = self.story_templates[theme]
-        else:
+        # Get the appropriate template, preferring a custom one registered for this theme
+        template = self.story_templates.get(f"{CUSTOM_TEMPLATE_PREFIX}{theme}")
+        if template is None:
+            template = self.story_templates.get(theme)
+        if template is None:
             # Fallback to a simple template if theme not found
             template = "{protagonist_name}, a {protagonist_social_class}, embarks on a journey of self-discovery."
         
@@ -300,25 +322,21 @@ class JaneAustenStoryGenerator:
             'protagonist_occupation': protagonist['occupation']
         }
         
-        # Format information about supporting characters
-        supporting_chars = []
-        for i, char in enumerate(characters[1:], 1):
-            char_info = {
-                f'character{i}_name': char['name'],
-                f'character{i}_social_class': char['social_class'],
-                f'character{i}_personality': char['personality'],
-                f'character{i}_occupation': char['occupation']
-            }
-            supporting_chars.append(char_info)
-        
-        # Combine all formatting information
+        # Combine all formatting information, adding supporting characters under interned keys
         format_info = {**protagonist_info, **settings}
-        for char_info in supporting_chars:
-            format_info.update(char_info)
+        for i, char in enumerate(characters[1:], 1):
+            name_key, class_key, personality_key, occupation_key = _character_keys(i)
+            format_info[name_key] = char['name']
+            format_info[class_key] = char['social_class']
+            format_info[personality_key] = char['personality']
+            format_info[occupation_key] = char['occupation']
         
-        # Format the template
+        # Format the template; the enhanced templates are pre-parsed, so render those directly
         try:
-            story = template.format(**format_info)
+            if template is get_enhanced_story_templates().get(theme):
+                story = render_enhanced_template(theme, format_info)
+            else:
+                story = template.format_map(format_info)
         except KeyError as e:
             # Fallback in case template has placeholders we didn't provide
             print(f"Warning: Template formatting error {e}. Using simplified template.")
@@ -777,7 +795,7 @@ class JaneAustenStoryGenerator:
                 print(f"Warning: Couldn't generate timeline for saved file: {e}")
             
         if format_type == 'txt':
-            with open(f"{filename}.txt", 'w') as file:
+            with open_atomic(f"{filename}.txt") as file:
                 file.write(story + timeline_content)
             print(f"Story saved as {filename}.txt")
             return f"{filename}.txt"
@@ -792,8 +810,8 @@ class JaneAustenStoryGenerator:
                 "word_count": len(story.split())
             }
             
-            with open(f"{filename}.json", 'w') as file:
-                json.dump(story_data, file, indent=2)
+            with open_atomic(f"{filename}.json", 'wb') as file:
+                file.write(dump_story_json(story_data))
             print(f"Story saved as {filename}.json")
             return f"{filename}.json"
             
@@ -826,7 +844,7 @@ class JaneAustenStoryGenerator:
 </body>
 </html>
 """
-            with open(f"{filename}.html", 'w') as file:
+            with open_atomic(f"{filename}.html") as file:
                 file.write(html_content)
             print(f"Story saved as {filename}.html")
             return f"{filename}.html"
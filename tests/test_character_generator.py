@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_generator
+from character_generator import CharacterGenerator
+
+# Prints the cast drawn from a seeded module RNG
+_SEEDED_CAST_SCRIPT = (
+    "import character_generator as cg; cg._rng.seed(42); "
+    "print(cg.CharacterGenerator().create_characters(4))"
+)
+
+
+class SeededCastTest(unittest.TestCase):
+    def test_same_seed_gives_same_cast(self):
+        generator = CharacterGenerator()
+        character_generator._rng.seed(42)
+        first = generator.create_characters(4)
+        character_generator._rng.seed(42)
+        self.assertEqual(generator.create_characters(4), first)
+
+    def test_cast_does_not_depend_on_hash_seed(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        casts = set()
+        for hash_seed in ('1', '2', '3'):
+            result = subprocess.run(
+                [sys.executable, '-c', _SEEDED_CAST_SCRIPT],
+                cwd=root, env={**os.environ, 'PYTHONHASHSEED': hash_seed},
+                capture_output=True, text=True, check=True
+            )
+            casts.add(result.stdout)
+        self.assertEqual(len(casts), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
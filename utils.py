@@ -2,11 +2,43 @@
 Utility functions for the Jane Austen storytelling experience.
 """
 
+import contextlib
 import os
+import re
 import sys
 import time
 import random
 
+# Story data is encoded and parsed with orjson when available, falling back to the stdlib.
+# orjson can also parse straight from a memoryview; json.loads needs bytes or str.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    
+    def dump_story_json(story_data):
+        """Encode story data as indented UTF-8 JSON bytes"""
+        return orjson.dumps(story_data, option=orjson.OPT_INDENT_2)
+    
+    load_json = orjson.loads
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+    
+    def dump_story_json(story_data):
+        """Encode story data as indented UTF-8 JSON bytes"""
+        return json.dumps(story_data, indent=2).encode('utf-8')
+    
+    load_json = json.loads
+
+# Write buffer for saved files, so long stories go out in a few large writes
+_SAVE_BUFFER_SIZE = 1 << 16
+
+# Candidate sentence breaks: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r'[.!?]\s+')
+
+# Titles whose period doesn't end a sentence
+_TITLES = frozenset({"Mr.", "Mrs.", "Ms.", "Dr.", "St."})
+
 def clear_screen():
     """Clear the terminal screen"""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -26,6 +58,23 @@ def print_with_typing_effect(text, delay=0.03, variance=0.01):
     # Add a newline at the end
     print()
 
+def print_menu(options):
+    """Print numbered menu options with a single write"""
+    sys.stdout.write("\n".join(f"{i}. {option}" for i, option in enumerate(options, 1)) + "\n")
+
+@contextlib.contextmanager
+def open_atomic(path, mode='w'):
+    """Open a temp file for writing that replaces path on success, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, buffering=_SAVE_BUFFER_SIZE) as file:
+            yield file
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
 def get_user_input(prompt, voice_input_func=None):
     """Get user input with optional voice input support"""
     if voice_input_func:
@@ -72,6 +121,26 @@ I remain, yours sincerely,
 """
     return letter
 
+def split_sentences(text, min_length=10):
+    """Split text into sentences, skipping titles like "Mr." and merging fragments shorter than min_length"""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.start() + 1
+        # Only the last word before the break can be a title, and titles are at most 4 characters
+        last_word = text[max(start, end - 5):end].split()
+        if last_word and last_word[-1] in _TITLES:
+            continue
+        sentence = text[start:end].strip()
+        if len(sentence) >= min_length:
+            sentences.append(sentence)
+            start = match.end()
+    
+    remainder = text[start:].strip()
+    if remainder:
+        sentences.append(remainder)
+    return sentences
+
 def word_count(text):
     """Count words in text"""
     return len(text.split())
@@ -4,6 +4,7 @@ Provides ASCII art representations of locations, characters, and events.
 """
 
 import random
+import sys
 import textwrap
 import time
 import re
@@ -70,6 +71,10 @@ class VisualImageryGenerator:
             "drawing_room": self._drawing_room_scene,
             "dinner": self._dinner_scene,
         }
+        
+        # Headers and dividers are deterministic, so each is built once per set of arguments
+        self._header_cache = {}
+        self._divider_cache = {}
 
     def create_location_illustration(self, location, season):
         """
@@ -273,48 +278,59 @@ class VisualImageryGenerator:
         
         print("\n".join(empty_frame))
         
-        # Now animate the text appearing
-        full_text = ""
+        # Now animate the text appearing, one frame per character
         for i, line in enumerate(wrapped_lines):
-            for char in line:
-                # Find the position of the line in the frame
-                line_pos = i + 2  # +2 for the top frame borders
-                
-                # Update the current line with one more character
-                full_text += char
-                padded_line = (full_text + (" " * (max_width - len(full_text)))).ljust(max_width)
-                
-                # Print cursor up to the line position
-                print(f"\033[{len(empty_frame) - line_pos}A", end="")
-                
-                # Print the updated line
-                print(f"║   {padded_line}   ║")
-                
-                # Return cursor to bottom
-                print(f"\033[{len(empty_frame) - line_pos}B", end="")
-                
-                time.sleep(delay)
+            # Find the position of the line in the frame
+            line_pos = i + 2  # +2 for the top frame borders
             
-            # Reset for next line
-            full_text = ""
+            # Cursor up to the line, the updated line, then cursor back to bottom
+            up = f"\033[{len(empty_frame) - line_pos}A"
+            down = f"\033[{len(empty_frame) - line_pos}B"
+            frames = [
+                (
+                    f"{up}║   {line[:end].ljust(max_width)}   ║\n{down}",
+                    end == len(line) or line[end - 1] == " "
+                )
+                for end in range(1, len(line) + 1)
+            ]
+            self._play_frames(frames, delay)
         
         # Animate the source line
         source_text = f"— {source}"
-        for i in range(len(source_text) + 1):
-            # Print cursor up to the source line position
-            print(f"\033[2A", end="")
-            
-            # Print the updated source line
-            partial_source = source_text[:i].rjust(max_width)
-            print(f"║   {partial_source}   ║")
-            
-            # Return cursor to bottom
-            print(f"\033[2B", end="")
-            
-            time.sleep(delay)
+        frames = [
+            (
+                f"\033[2A║   {source_text[:end].rjust(max_width)}   ║\n\033[2B",
+                end == len(source_text) or source_text[end - 1] == " "
+            )
+            for end in range(len(source_text) + 1)
+        ]
+        self._play_frames(frames, delay)
         
         return "\n".join(frame)
     
+    @staticmethod
+    def _play_frames(frames, delay):
+        """
+        Write animation frames a word at a time
+        
+        Args:
+            frames: (text, ends_word) pairs, one per animation step
+            delay: Time delay per step; a word's steps share one write and one sleep
+        """
+        pending = []
+        for text, ends_word in frames:
+            pending.append(text)
+            if ends_word:
+                sys.stdout.write("".join(pending))
+                sys.stdout.flush()
+                time.sleep(delay * len(pending))
+                pending.clear()
+        
+        if pending:
+            sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+            time.sleep(delay * len(pending))
+    
     def create_story_header(self, theme, location, season):
         """
         Create a decorative header for a story with theme and location
@@ -327,6 +343,11 @@ class VisualImageryGenerator:
         Returns:
             A decorated story header with thematic imagery
         """
+        cache_key = (theme, location, season)
+        cached = self._header_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Create a decorative border
         width = 70
         
@@ -369,7 +390,9 @@ class VisualImageryGenerator:
             '---'
             """)
             
-        return "\n".join(header)
+        story_header = "\n".join(header)
+        self._header_cache[cache_key] = story_header
+        return story_header
     
     def create_ornamental_divider(self, width=70, style="classic"):
         """
@@ -382,12 +405,20 @@ class VisualImageryGenerator:
         Returns:
             A decorative divider ASCII art
         """
+        cache_key = (width, style)
+        divider = self._divider_cache.get(cache_key)
+        if divider is not None:
+            return divider
+        
         if style == "floral":
-            return "❦" * (width // 2)
+            divider = "❦" * (width // 2)
         elif style == "simple":
-            return "─" * width
+            divider = "─" * width
         else:  # classic
-            return "┄┄┄" + "❧" + "┄┄┄" * ((width - 7) // 3) + "❧" + "┄┄┄"
+            divider = "┄┄┄" + "❧" + "┄┄┄" * ((width - 7) // 3) + "❧" + "┄┄┄"
+        
+        self._divider_cache[cache_key] = divider
+        return divider
             
     def get_quote_with_themed_frame(self, quote, theme=None):
         """